@@ -0,0 +1,51 @@
+"""full text search
+
+Revision ID: 7c1e9b2f4a10
+Revises: 2396acf752a5
+Create Date: 2026-10-18 09:12:41.204318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e9b2f4a10'
+down_revision: Union[str, None] = '2396acf752a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _vector(*weighted):
+    return " || ".join(
+        f"setweight(to_tsvector('french', coalesce({col}, '')), '{weight}')"
+        for col, weight in weighted
+    )
+
+
+TABLES = {
+    'articles': _vector(('title', 'A'), ('excerpt', 'B'), ('content', 'C')),
+    'publications': _vector(('title', 'A'), ('excerpt', 'B'), ('content', 'C')),
+    'boutique_items': _vector(('name', 'A'), ('description', 'B'), ('content', 'C')),
+}
+
+
+def upgrade() -> None:
+    for table, expression in TABLES.items():
+        op.add_column(table, sa.Column(
+            'search_vector', postgresql.TSVECTOR(),
+            sa.Computed(expression, persisted=True), nullable=True,
+        ))
+        op.create_index(
+            f'ix_{table}_search_vector', table, ['search_vector'],
+            unique=False, postgresql_using='gin',
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(list(TABLES)):
+        op.drop_index(f'ix_{table}_search_vector', table_name=table, postgresql_using='gin')
+        op.drop_column(table, 'search_vector')
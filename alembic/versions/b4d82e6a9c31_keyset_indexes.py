@@ -0,0 +1,41 @@
+"""keyset indexes
+
+Revision ID: b4d82e6a9c31
+Revises: 7c1e9b2f4a10
+Create Date: 2026-10-18 10:03:17.562904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d82e6a9c31'
+down_revision: Union[str, None] = '7c1e9b2f4a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# table -> colonne de date du tri public
+TABLES = {
+    'articles': 'published_at',
+    'publications': 'published_at',
+    'boutique_items': 'created_at',
+}
+
+
+def upgrade() -> None:
+    for table, date_col in TABLES.items():
+        op.create_index(
+            f'ix_{table}_published_keyset', table, [date_col, 'id'],
+            unique=False, postgresql_where=sa.text("status = 'published'"),
+        )
+        op.create_index(f'ix_{table}_created_keyset', table, ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    for table in reversed(list(TABLES)):
+        op.drop_index(f'ix_{table}_created_keyset', table_name=table)
+        op.drop_index(f'ix_{table}_published_keyset', table_name=table)
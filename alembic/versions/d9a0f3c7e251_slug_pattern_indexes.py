@@ -0,0 +1,33 @@
+"""slug pattern indexes
+
+Revision ID: d9a0f3c7e251
+Revises: b4d82e6a9c31
+Create Date: 2026-10-18 11:26:05.913472
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a0f3c7e251'
+down_revision: Union[str, None] = 'b4d82e6a9c31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ('articles', 'publications', 'boutique_items')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.create_index(
+            f'ix_{table}_slug_pattern', table, ['slug'],
+            unique=False, postgresql_ops={'slug': 'varchar_pattern_ops'},
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_index(f'ix_{table}_slug_pattern', table_name=table)
@@ -0,0 +1,26 @@
+"""user token version
+
+Revision ID: e5b17c4d8a06
+Revises: d9a0f3c7e251
+Create Date: 2026-10-18 12:41:52.318877
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b17c4d8a06'
+down_revision: Union[str, None] = 'd9a0f3c7e251'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'token_version')
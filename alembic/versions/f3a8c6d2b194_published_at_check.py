@@ -0,0 +1,51 @@
+"""published_at check
+
+Revision ID: f3a8c6d2b194
+Revises: e5b17c4d8a06
+Create Date: 2026-10-18 17:12:40.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8c6d2b194'
+down_revision: Union[str, None] = 'e5b17c4d8a06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables dont la liste publique est triée par published_at (nullable)
+TABLES = ('articles', 'publications')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        # Contenus publiés sans date (imports) : datés de leur création
+        op.execute(
+            f"UPDATE {table} SET published_at = created_at "
+            f"WHERE status = 'published' AND published_at IS NULL"
+        )
+        op.create_check_constraint(
+            f'ck_{table}_published_at', table, "status <> 'published' OR published_at IS NOT NULL",
+        )
+        # Index keyset sur la clé de tri de core.pagination.sort_date
+        op.drop_index(f'ix_{table}_published_keyset', table_name=table)
+        op.create_index(
+            f'ix_{table}_published_keyset', table,
+            [sa.text("coalesce(published_at, '-infinity'::timestamptz)"), 'id'],
+            unique=False, postgresql_where=sa.text("status = 'published'"),
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_index(f'ix_{table}_published_keyset', table_name=table)
+        op.create_index(
+            f'ix_{table}_published_keyset', table, ['published_at', 'id'],
+            unique=False, postgresql_where=sa.text("status = 'published'"),
+        )
+        op.drop_constraint(f'ck_{table}_published_at', table, type_='check')
@@ -0,0 +1,91 @@
+# benchmarks/bench_bulk.py
+#
+# Débit des écritures : N appels unitaires (POST, PUT, DELETE /api/articles/…)
+# vs les lots /api/articles/bulk, à travers toute l'application (authentification,
+# transaction, invalidation) sans serveur HTTP. Base migrée et compte admin requis ;
+# les articles créés sont supprimés à la fin. httpx requis (outil de dev).
+#
+#   DATABASE_URL=postgresql+asyncpg://… SECRET_KEY=… \
+#   BENCH_EMAIL=admin@example.org BENCH_PASSWORD=… python -m benchmarks.bench_bulk [N]
+
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+
+from main import app
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 200   # ≤ schemas.bulk.BULK_MAX_ITEMS
+
+
+def report(label: str, seconds: float) -> float:
+    print(f"{label:<32} {seconds * 1e3:9.1f} ms   {N / seconds:8.0f} éléments/s")
+    return seconds
+
+
+async def timed(coro) -> float:
+    start = time.perf_counter()
+    await coro
+    return time.perf_counter() - start
+
+
+async def main():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        r = await client.post("/api/auth/login", data={
+            "username": os.environ["BENCH_EMAIL"], "password": os.environ["BENCH_PASSWORD"],
+        })
+        r.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {r.json()['access_token']}"
+        items = [{"title": f"Bench lot {i}", "content": "<p>Contenu</p>" * 20} for i in range(N)]
+
+        async def single_create():
+            for item in items:
+                (await client.post("/api/articles", json=item)).raise_for_status()
+
+        async def bulk_create():
+            (await client.post("/api/articles/bulk", json={"items": items})).raise_for_status()
+
+        async def ids():
+            r = await client.get("/api/articles/admin/all", params={"search": "Bench lot", "per_page": 50, "include_total": False})
+            found, cursor = [], None
+            while True:
+                page = r.json()
+                found += [a["id"] for a in page["items"]]
+                if not (cursor := page["next_cursor"]):
+                    return found
+                r = await client.get("/api/articles/admin/all", params={"search": "Bench lot", "per_page": 50, "cursor": cursor})
+
+        async def single_update(created):
+            for id_ in created:
+                (await client.put(f"/api/articles/{id_}", json={"status": "published"})).raise_for_status()
+
+        async def bulk_status(created):
+            (await client.post("/api/articles/bulk/status", json={"ids": created, "status": "published"})).raise_for_status()
+
+        async def single_delete(created):
+            for id_ in created:
+                (await client.delete(f"/api/articles/{id_}")).raise_for_status()
+
+        async def bulk_delete(created):
+            (await client.post("/api/articles/bulk/delete", json={"ids": created})).raise_for_status()
+
+        print(f"{N} articles\n")
+        single = [
+            report("création — unitaire", await timed(single_create())),
+            report("publication — unitaire", await timed(single_update(created := await ids()))),
+            report("suppression — unitaire", await timed(single_delete(created))),
+        ]
+        bulk = [
+            report("création — lot", await timed(bulk_create())),
+            report("publication — lot", await timed(bulk_status(created := await ids()))),
+            report("suppression — lot", await timed(bulk_delete(created))),
+        ]
+        print("\n" + ", ".join(
+            f"x{before / after:.0f} {op}" for op, before, after in zip(("création", "publication", "suppression"), single, bulk)
+        ))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
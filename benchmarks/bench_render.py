@@ -0,0 +1,79 @@
+# benchmarks/bench_render.py
+#
+# Sérialisation d'une page de 50 articles (avec catégorie et auteur) :
+# - response_model : ArticleListOut(...) puis validation + sérialisation par FastAPI
+#   (ancien chemin des listes admin) ;
+# - model_dump_json : ArticleListOut(...).model_dump_json() (ancien chemin public mis en cache) ;
+# - core.render : lecture directe des attributs ORM + orjson.
+# Lignes ORM transitoires construites en mémoire — sans base de données.
+#
+#   DATABASE_URL=postgresql+asyncpg://x/x SECRET_KEY=x python -m benchmarks.bench_render
+
+import asyncio
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+import models.user        # noqa
+import models.publication # noqa
+import models.boutique    # noqa
+from core.render import render
+from models.article import Article
+from models.category import Category
+from models.user import User
+from schemas.article import ArticleListOut
+
+N = 200
+PER_PAGE = 50
+
+now = datetime.now(timezone.utc)
+author = User(id=1, email="admin@example.org", username="admin", password="x",
+              is_active=True, is_admin=True, created_at=now)
+category = Category(id=3, name="Actualités", slug="actualites", content_type="article")
+rows = [
+    Article(
+        id=i, title=f"Article numéro {i}", slug=f"article-numero-{i}",
+        excerpt="Un résumé de quelques lignes pour la carte de l'article.",
+        content="<p>" + "Paragraphe de contenu HTML assez long. " * 60 + "</p>",
+        image_url=f"/uploads/{i:064x}.jpg", category_id=3, status="published",
+        published_at=now - timedelta(days=i), created_at=now - timedelta(days=i), updated_at=now,
+        category=category, author=author,
+    )
+    for i in range(PER_PAGE)
+]
+page = dict(total=500, total_pages=10, page=1, per_page=PER_PAGE, has_more=True, next_cursor=None)
+field = create_model_field(name="Response_list", type_=ArticleListOut, mode="serialization")
+loop = asyncio.new_event_loop()
+
+
+def response_model():
+    content = ArticleListOut(items=rows, **page)
+    data = loop.run_until_complete(serialize_response(field=field, response_content=content))
+    JSONResponse(data).body
+
+
+def model_dump_json():
+    ArticleListOut(items=rows, **page).model_dump_json().encode()
+
+
+def fast_render():
+    render(ArticleListOut, items=rows, **page)
+
+
+def bench(label, fn):
+    fn()
+    per_call = min(timeit.repeat(fn, number=N, repeat=5)) / N * 1e3
+    print(f"{label:<28} {per_call:8.3f} ms / page")
+    return per_call
+
+
+if __name__ == "__main__":
+    assert render(ArticleListOut, items=rows, **page) == ArticleListOut(items=rows, **page).model_dump_json().encode()
+    print(f"{PER_PAGE} articles, {len(render(ArticleListOut, items=rows, **page)) // 1024} Ko de JSON\n")
+    after = bench("core.render", fast_render)
+    for label, fn in [("response_model", response_model), ("model_dump_json", model_dump_json)]:
+        before = bench(label, fn)
+        print(f"{'':<28} x{before / after:.1f}")
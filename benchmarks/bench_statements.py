@@ -0,0 +1,71 @@
+# benchmarks/bench_statements.py
+#
+# Surcoût Python par requête : construction d'un select() à chaque appel
+# (ancien code des routers) vs requêtes préconstruites de core.statements.
+# Mesure construction + clé de cache SQLAlchemy (ce que paie chaque execute()
+# avant de retrouver la compilation en cache) — sans base de données.
+#
+#   DATABASE_URL=postgresql+asyncpg://x/x SECRET_KEY=x python -m benchmarks.bench_statements
+
+import timeit
+from sqlalchemy import select, func, literal_column
+
+from core.search import ts_match, ts_rank
+from core.statements import by_id, by_slug, list_page, list_stats, public_filters
+from models.article import Article
+from models.category import Category
+from models.user import User
+
+N = 20_000
+
+
+def dynamic_slug():
+    q = select(Article).where(Article.slug == "un-article", Article.status == "published")
+    q._generate_cache_key()
+
+
+def registry_slug():
+    by_slug(Article)._generate_cache_key()
+
+
+def dynamic_user():
+    select(User).where(User.id == 1)._generate_cache_key()
+
+
+def registry_user():
+    by_id(User)._generate_cache_key()
+
+
+def dynamic_list():
+    published = Article.status == literal_column("'published'")
+    category = Article.category_id == select(Category.id).where(Category.slug == "actu").scalar_subquery()
+    match = ts_match(Article.search_vector, "jardin")
+    select(func.count(), func.max(Article.updated_at)).select_from(Article) \
+        .where(published, category, match)._generate_cache_key()
+    select(Article).where(published, category, match) \
+        .order_by(ts_rank(Article.search_vector, "jardin").desc(), Article.published_at.desc(), Article.id.desc()) \
+        .offset(9).limit(10)._generate_cache_key()
+
+
+def registry_list():
+    filters = public_filters(Article, True, True)
+    list_stats(Article, filters)._generate_cache_key()
+    list_page(Article, "published_at", filters, True, False)._generate_cache_key()
+
+
+def bench(label, fn):
+    fn()
+    per_call = min(timeit.repeat(fn, number=N, repeat=5)) / N * 1e6
+    print(f"{label:<42} {per_call:8.1f} µs")
+    return per_call
+
+
+if __name__ == "__main__":
+    for name, dynamic, registry in [
+        ("slug lookup", dynamic_slug, registry_slug),
+        ("get_current_user", dynamic_user, registry_user),
+        ("public list (count + page)", dynamic_list, registry_list),
+    ]:
+        before = bench(f"{name} — select()", dynamic)
+        after = bench(f"{name} — registre", registry)
+        print(f"{'':<42} gain {before - after:6.1f} µs / requête\n")
@@ -0,0 +1,77 @@
+# benchmarks/bench_transfer.py
+#
+# Sauvegarde / migration de ROWS articles à travers toute l'application :
+# - import NDJSON (COPY vers table temporaire + upsert) : première passe = insertions,
+#   seconde = mises à jour ;
+# - export NDJSON et CSV (curseur serveur, flux) ;
+# - ancienne méthode : pages de 50 de /api/articles/admin/all (OFFSET).
+# Base migrée, compte admin et catégorie aucune requis ; les articles « bench-transfer-* »
+# sont supprimés à la fin. httpx requis (outil de dev).
+#
+#   DATABASE_URL=postgresql+asyncpg://… SECRET_KEY=… \
+#   BENCH_EMAIL=admin@example.org BENCH_PASSWORD=… python -m benchmarks.bench_transfer [ROWS]
+
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+import orjson
+from sqlalchemy import text
+
+from core.database import engine
+from main import app
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+CONTENT = "<p>" + "Paragraphe de contenu HTML. " * 30 + "</p>"
+
+
+def report(label: str, seconds: float, size: int | None = None) -> None:
+    extra = f"   {size / seconds / 2**20:6.1f} Mo/s" if size else ""
+    print(f"{label:<36} {seconds:8.2f} s   {ROWS / seconds:9.0f} lignes/s{extra}")
+
+
+async def main():
+    body = b"".join(
+        orjson.dumps({
+            "title": f"Article {i}", "slug": f"bench-transfer-{i}", "excerpt": "Résumé",
+            "content": CONTENT, "status": "published", "published_at": "2026-01-01T00:00:00Z",
+        }) + b"\n"
+        for i in range(ROWS)
+    )
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=None) as client:
+        r = await client.post("/api/auth/login", data={
+            "username": os.environ["BENCH_EMAIL"], "password": os.environ["BENCH_PASSWORD"],
+        })
+        r.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {r.json()['access_token']}"
+        print(f"{ROWS} articles, {len(body) / 2**20:.0f} Mo de NDJSON\n")
+
+        try:
+            for label in ("import NDJSON — insertions", "import NDJSON — mises à jour"):
+                start = time.perf_counter()
+                (await client.post("/api/admin/import/articles", content=body)).raise_for_status()
+                report(label, time.perf_counter() - start, len(body))
+
+            for fmt in ("ndjson", "csv"):
+                start = time.perf_counter()
+                r = await client.get("/api/admin/export/articles", params={"format": fmt})
+                r.raise_for_status()
+                report(f"export {fmt.upper()}", time.perf_counter() - start, len(r.content))
+
+            start = time.perf_counter()
+            page, pages = 1, 1
+            while page <= pages:
+                r = await client.get("/api/articles/admin/all", params={"page": page, "per_page": 50})
+                r.raise_for_status()
+                pages = r.json()["total_pages"]
+                page += 1
+            report("pages de 50 (/admin/all, OFFSET)", time.perf_counter() - start)
+        finally:
+            async with engine.begin() as conn:
+                await conn.execute(text("DELETE FROM articles WHERE slug LIKE 'bench-transfer-%'"))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,181 @@
+# core/bulk.py
+
+"""
+Écritures groupées du backoffice : créations, modifications, changement de statut
+et suppressions d'un lot dans la transaction de la requête, en requêtes
+multi-lignes (INSERT … VALUES multiple, UPDATE par clé primaire en executemany,
+UPDATE / DELETE … WHERE id = ANY) au lieu d'un appel HTTP par élément.
+
+Chaque élément reçoit son résultat (cf. schemas.bulk) : id absent, catégorie
+inconnue ou slug impossible à attribuer sont signalés individuellement ; toute
+autre erreur annule le lot entier.
+"""
+
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from fastapi import HTTPException
+from sqlalchemy import ARRAY, Integer, String, any_, bindparam, case, delete, literal_column, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.categories import category_registry
+from core.slugs import MAX_ATTEMPTS, free_slugs, is_slug_conflict
+
+IDS = bindparam("ids", type_=ARRAY(Integer))
+SLUGS = bindparam("slugs", type_=ARRAY(String))
+NOW = bindparam("now")
+
+SUCCESS = frozenset({"created", "updated", "deleted"})
+
+
+def _result(index: int, status: str, id: int | None = None, slug: str | None = None, detail: str | None = None) -> dict:
+    return {"index": index, "status": status, "id": id, "slug": slug, "detail": detail}
+
+
+def _out(results: list[dict]) -> dict:
+    ok = sum(r["status"] in SUCCESS for r in results)
+    return {"ok": ok, "failed": len(results) - ok, "results": results}
+
+
+def _has_published_at(model) -> bool:
+    return "published_at" in model.__table__.c
+
+
+@lru_cache(maxsize=None)
+def _states(model):
+    return select(model.id, model.status, model.slug).where(model.id == any_(IDS))
+
+
+@lru_cache(maxsize=None)
+def _slug_owners(model):
+    return select(model.slug, model.id).where(model.slug == any_(SLUGS))
+
+
+@lru_cache(maxsize=None)
+def _set_status(model, status: str):
+    values = {"status": status, "updated_at": NOW}
+    if _has_published_at(model):
+        # Même règle que la modification unitaire : date de publication au premier passage
+        was_published = model.status == literal_column("'published'")
+        values["published_at"] = (
+            case((was_published, model.published_at), else_=NOW) if status == "published" else None
+        )
+    return (
+        update(model).where(model.id == any_(IDS)).values(values)
+        .returning(model.id, model.slug).execution_options(synchronize_session=False)
+    )
+
+
+@lru_cache(maxsize=None)
+def _delete(model):
+    return (
+        delete(model).where(model.id == any_(IDS))
+        .returning(model.id, model.slug).execution_options(synchronize_session=False)
+    )
+
+
+async def bulk_create(db: AsyncSession, model, rows: list[dict], bases: list[str]) -> dict:
+    """
+    rows : colonnes de chaque élément (sans slug) ; bases : slug voulu de chacun.
+    Slugs libres attribués en un SELECT puis INSERT multi-lignes ; un slug pris entre-temps
+    par une création concurrente (ON CONFLICT DO NOTHING) est réattribué au tour suivant.
+    """
+    results: list[dict | None] = [None] * len(rows)
+    unknown = await category_registry.unknown(row.get("category_id") for row in rows)
+    pending = []
+    for index, row in enumerate(rows):
+        if row.get("category_id") in unknown:
+            results[index] = _result(index, "invalid", detail="Catégorie inconnue")
+        else:
+            pending.append(index)
+
+    for _ in range(MAX_ATTEMPTS):
+        if not pending:
+            break
+        slugs = await free_slugs(db, model, [bases[index] for index in pending])
+        inserted = dict((await db.execute(
+            insert(model)
+            .values([rows[index] | {"slug": slug} for index, slug in zip(pending, slugs)])
+            .on_conflict_do_nothing(index_elements=[model.slug])
+            .returning(model.slug, model.id)
+        )).all())
+        retry = []
+        for index, slug in zip(pending, slugs):
+            if slug in inserted:
+                results[index] = _result(index, "created", inserted[slug], slug)
+            else:
+                retry.append(index)
+        pending = retry
+
+    for index in pending:
+        results[index] = _result(index, "conflict", detail=f"Impossible d'attribuer un slug libre pour '{bases[index]}'")
+    return _out(results)
+
+
+async def bulk_update(db: AsyncSession, model, items: list[dict]) -> dict:
+    """items : champs fournis de chaque élément (exclude_unset), avec son id."""
+    rows = (await db.execute(_states(model), {"ids": [item["id"] for item in items]})).all()
+    current = {id_: status for id_, status, _ in rows}
+    slugs = {id_: slug for id_, _, slug in rows}
+    unknown = await category_registry.unknown(item.get("category_id") for item in items)
+    # Slug demandé déjà pris par une autre ligne (ou par un élément précédent du lot) :
+    # conflit de cet élément seul. Un échange de slugs dans le lot est refusé aussi.
+    wanted = [item["slug"] for item in items if item.get("slug")]
+    owners = dict((await db.execute(_slug_owners(model), {"slugs": wanted})).all()) if wanted else {}
+    now = datetime.now(timezone.utc)
+    results, params = [], []
+    for index, item in enumerate(items):
+        id_ = item["id"]
+        if id_ not in current:
+            results.append(_result(index, "not_found", id_, detail="Introuvable"))
+            continue
+        if item.get("category_id") in unknown:
+            results.append(_result(index, "invalid", id_, detail="Catégorie inconnue"))
+            continue
+        if (slug := item.get("slug")) and owners.setdefault(slug, id_) != id_:
+            results.append(_result(index, "conflict", id_, detail=f"Slug '{slug}' déjà utilisé"))
+            continue
+        row = item | {"updated_at": now}
+        status = item.get("status")
+        if _has_published_at(model):
+            if status == "published" and current[id_] != "published":
+                row["published_at"] = now
+            if status == "draft" and current[id_] == "published":
+                row["published_at"] = None
+        current[id_] = status or current[id_]
+        params.append(row)
+        slugs[id_] = item.get("slug") or slugs[id_]
+        results.append(_result(index, "updated", id_, slugs[id_]))
+
+    if params:
+        try:
+            # UPDATE par clé primaire : une requête executemany par combinaison de champs
+            await db.execute(update(model), params)
+        except IntegrityError as exc:
+            # Slug pris par une écriture concurrente depuis la vérification : lot à rejouer
+            if not is_slug_conflict(exc, model):
+                raise
+            raise HTTPException(409, "Slug pris entre-temps par une autre modification, réessayez") from exc
+    return _out(results)
+
+
+async def bulk_set_status(db: AsyncSession, model, ids: list[int], status: str) -> dict:
+    changed = dict((await db.execute(_set_status(model, status), {
+        "ids": ids, "now": datetime.now(timezone.utc),
+    })).all())
+    return _out([
+        _result(index, "updated", id_, changed[id_]) if id_ in changed
+        else _result(index, "not_found", id_, detail="Introuvable")
+        for index, id_ in enumerate(ids)
+    ])
+
+
+async def bulk_delete(db: AsyncSession, model, ids: list[int]) -> dict:
+    deleted = dict((await db.execute(_delete(model), {"ids": ids})).all())
+    return _out([
+        _result(index, "deleted", id_, deleted[id_]) if id_ in deleted
+        else _result(index, "not_found", id_, detail="Introuvable")
+        for index, id_ in enumerate(ids)
+    ])
@@ -0,0 +1,109 @@
+# core/cache.py
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.database import after_commit
+
+
+class TTLCache:
+    """
+    Cache mémoire borné : éviction LRU au-delà de maxsize entrées (ou de maxweight,
+    p. ex. en octets), expiration après ttl secondes.
+    Les clés sont des tuples dont le premier élément est un espace de noms
+    (« article », « publication »…) pour pouvoir invalider un type de contenu d'un coup.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, maxweight: int | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxweight = maxweight
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any, int]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                self._pop(key)
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, weight: int = 1) -> None:
+        if key in self._data:
+            self._pop(key)
+        self._data[key] = (time.monotonic() + self.ttl, value, weight)
+        self.weight += weight
+        self._evict()
+
+    def reweight(self, key: Hashable, weight: int) -> None:
+        """Nouveau poids d'une entrée présente (valeur complétée depuis set), budget réappliqué."""
+        entry = self._data.get(key)
+        if entry is None or entry[2] == weight:
+            return
+        self._data[key] = (entry[0], entry[1], weight)
+        self.weight += weight - entry[2]
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._data and (
+            len(self._data) > self.maxsize
+            or (self.maxweight is not None and self.weight > self.maxweight)
+        ):
+            self._pop(next(iter(self._data)))
+
+    def invalidate(self, namespace: str) -> None:
+        for key in [k for k in self._data if k[0] == namespace]:
+            self._pop(key)
+
+    def discard(self, predicate) -> None:
+        """Retire les entrées dont la valeur vérifie predicate(value)."""
+        for key in [k for k, entry in self._data.items() if predicate(entry[1])]:
+            self._pop(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.weight = 0
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "weight": self.weight,
+            "maxweight": self.maxweight,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _pop(self, key: Hashable) -> None:
+        self.weight -= self._data.pop(key)[2]
+
+
+# Registre des caches invalidés par type de contenu (cf. invalidate)
+caches: dict[str, TTLCache] = {}
+
+
+def register(name: str, cache: TTLCache) -> TTLCache:
+    caches[name] = cache
+    return cache
+
+
+def invalidate(db: AsyncSession, *namespaces: str) -> None:
+    """
+    À appeler par les handlers create/update/delete : vide les entrées de ces types
+    de contenu dans tous les caches du registre, une fois la transaction validée.
+    """
+    def run():
+        for cache in caches.values():
+            for namespace in namespaces:
+                cache.invalidate(namespace)
+
+    after_commit(db, run)
@@ -0,0 +1,125 @@
+# core/categories.py
+
+import asyncio
+import hashlib
+import time
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from core.config import settings
+from core.database import AsyncSessionLocal, after_commit
+from models.category import Category
+
+
+class CategoryRegistry:
+    """
+    Table categories en mémoire (quelques dizaines de lignes, rarement modifiée) :
+    résolution slug → id, liste publique et catégorie des contenus, sans requête ni jointure.
+
+    Chargée au démarrage, rechargée après chaque écriture de catégorie dans ce processus
+    et au plus tard après CATEGORY_REGISTRY_TTL_SECONDS pour celles faites par un autre
+    worker Passenger. Les objets sont des Category détachées, en lecture seule.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.by_id: dict[int, Category] = {}
+        self.by_slug: dict[str, Category] = {}
+        self.ordered: list[Category] = []        # par nom, comme l'ancienne requête
+        self.fingerprint = ""                    # empreinte du contenu, identique entre processus
+        self.loaded_at = float("-inf")
+        self.reloads = 0
+        self._lock = asyncio.Lock()
+        self._reload: asyncio.Task | None = None
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() - self.loaded_at < self.ttl
+
+    async def load(self) -> None:
+        # Session dédiée : les objets sont détachés à sa fermeture, jamais liés à une requête
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(select(Category).order_by(Category.name, Category.id))).scalars().all()
+        self.ordered = list(rows)
+        self.by_id = {c.id: c for c in rows}
+        self.by_slug = {c.slug: c for c in rows}
+        self.fingerprint = hashlib.sha1(
+            "|".join(f"{c.id}:{c.slug}:{c.name}:{c.content_type}" for c in rows).encode()
+        ).hexdigest()[:16]
+        self.loaded_at = time.monotonic()
+        self.reloads += 1
+
+    async def ensure(self) -> None:
+        """Recharge si périmé ; une seule requête même si plusieurs handlers attendent."""
+        if self.fresh:
+            return
+        async with self._lock:
+            if not self.fresh:
+                await self.load()
+
+    def refresh(self, db: AsyncSession) -> None:
+        """À appeler par les handlers qui écrivent une catégorie : rechargement après commit."""
+        def run():
+            self.loaded_at = float("-inf")
+            self._reload = asyncio.get_running_loop().create_task(self.ensure())
+
+        after_commit(db, run)
+
+    async def _reload_missing(self) -> None:
+        """
+        Entrée absente : catégorie peut-être créée par un autre worker depuis le dernier
+        chargement. Au plus un rechargement par seconde (slugs inventés par un client).
+        """
+        if time.monotonic() - self.loaded_at > 1:
+            async with self._lock:
+                if time.monotonic() - self.loaded_at > 1:
+                    await self.load()
+
+    async def id_for(self, slug: str | None) -> int | None:
+        """Id de la catégorie slug (filtre ?category=), après rechargement si elle manque."""
+        if not slug:
+            return None
+        await self.ensure()
+        if slug not in self.by_slug:
+            await self._reload_missing()
+        category = self.by_slug.get(slug)
+        return category.id if category else None
+
+    def listing(self, content_type: str | None = None) -> list[Category]:
+        return [c for c in self.ordered if content_type is None or c.content_type == content_type]
+
+    async def unknown(self, ids: Iterable[int | None]) -> set[int]:
+        """Ids absents du registre, après rechargement s'il en manque (écritures groupées, attach)."""
+        ids = {i for i in ids if i is not None}
+        await self.ensure()
+        if not ids <= self.by_id.keys():
+            await self._reload_missing()
+        return ids - self.by_id.keys()
+
+    async def attach(self, rows: Iterable, fields: tuple[str, ...] | None = None) -> None:
+        """
+        Renseigne row.category depuis le registre, comme une relation déjà chargée
+        (set_committed_value : ni requête ni modification à enregistrer).
+        fields : projection de la page (cf. core.render.list_projection) — rien à faire
+        si elle n'inclut pas la catégorie.
+        """
+        if fields is not None and "category" not in fields:
+            return
+        rows = list(rows)
+        await self.unknown(r.category_id for r in rows)
+        for row in rows:
+            set_committed_value(row, "category", self.by_id.get(row.category_id))
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self.by_id),
+            "reloads": self.reloads,
+            "age_seconds": round(time.monotonic() - self.loaded_at, 1) if self.reloads else None,
+            "fingerprint": self.fingerprint,
+        }
+
+
+category_registry = CategoryRegistry(ttl=settings.CATEGORY_REGISTRY_TTL_SECONDS)
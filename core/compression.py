@@ -0,0 +1,167 @@
+# core/compression.py
+
+import gzip
+import time
+import zlib
+from dataclasses import dataclass, asdict
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.config import settings
+
+try:
+    import brotli
+except ImportError:  # optionnel : gzip seul sans le paquet brotli
+    brotli = None
+
+COMPRESSIBLE = (
+    "application/json", "application/x-ndjson", "application/javascript",
+    "image/svg+xml", "text/",
+)
+
+
+@dataclass
+class CompressionStats:
+    responses: int = 0
+    streamed: int = 0        # réponses en plusieurs morceaux (exports…)
+    memo_hits: int = 0       # corps compressés servis depuis le cache de réponses
+    bytes_in: int = 0
+    bytes_out: int = 0
+    cpu_seconds: float = 0.0
+
+    def snapshot(self) -> dict:
+        return asdict(self)
+
+
+compression_stats = CompressionStats()
+
+
+def negotiate(accept_encoding: str) -> str | None:
+    """Encodage retenu d'après Accept-Encoding : br de préférence, puis gzip."""
+    accepted = set()
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(name.strip().lower())
+    if brotli is not None and ("br" in accepted or "*" in accepted):
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def is_compressible(content_type: str | None) -> bool:
+    return bool(content_type) and content_type.startswith(COMPRESSIBLE)
+
+
+def compress(body: bytes, encoding: str, cached: bool = False) -> bytes:
+    start = time.thread_time()
+    if encoding == "br":
+        quality = settings.COMPRESSION_BROTLI_QUALITY_CACHED if cached else settings.COMPRESSION_BROTLI_QUALITY
+        out = brotli.compress(body, quality=quality)
+    else:
+        out = gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+    _account(len(body), len(out), time.thread_time() - start)
+    return out
+
+
+def _account(bytes_in: int, bytes_out: int, cpu: float) -> None:
+    compression_stats.bytes_in += bytes_in
+    compression_stats.bytes_out += bytes_out
+    compression_stats.cpu_seconds += cpu
+
+
+class _StreamCompressor:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._c = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+            self._write, self._finish = self._c.process, self._c.finish
+        else:
+            self._c = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._write, self._finish = self._c.compress, self._c.flush
+
+    def write(self, chunk: bytes, last: bool) -> bytes:
+        start = time.thread_time()
+        out = self._write(chunk) + (self._finish() if last else b"")
+        _account(len(chunk), len(out), time.thread_time() - start)
+        return out
+
+
+class CompressionMiddleware:
+    """
+    Compression gzip / Brotli négociée, au-delà de COMPRESSION_MIN_BYTES et pour les
+    types textuels seulement. Les réponses qui portent déjà un Content-Encoding
+    (cache de réponses, fichiers précompressés) passent telles quelles, de même que
+    les plages d'octets (206, Content-Range).
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = settings.COMPRESSION_MIN_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            return await self.app(scope, receive, send)
+        await self.app(scope, receive, _Responder(send, encoding, self.minimum_size).send)
+
+
+class _Responder:
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start: Message | None = None
+        self.passthrough = False
+        self.compressor: _StreamCompressor | None = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if self.passthrough or message["type"] != "http.response.body":
+            return await self._flush_start(message)
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressor is not None:
+            return await self._send({
+                "type": "http.response.body", "body": self.compressor.write(body, not more_body),
+                "more_body": more_body,
+            })
+
+        headers = MutableHeaders(raw=self.start["headers"])
+        if (
+            "content-encoding" in headers or not is_compressible(headers.get("content-type"))
+            # Plage d'octets : ses offsets portent sur le corps non compressé
+            or self.start["status"] == 206 or "content-range" in headers
+        ):
+            self.passthrough = True
+            return await self._flush_start(message)
+
+        headers.add_vary_header("Accept-Encoding")
+        if not more_body and len(body) < self.minimum_size:
+            self.passthrough = True
+            return await self._flush_start(message)
+
+        headers["Content-Encoding"] = self.encoding
+        compression_stats.responses += 1
+        if more_body:
+            # Flux (export…) : compression au fil de l'eau, longueur inconnue
+            compression_stats.streamed += 1
+            del headers["Content-Length"]
+            self.compressor = _StreamCompressor(self.encoding)
+            body = self.compressor.write(body, False)
+        else:
+            body = compress(body, self.encoding)
+            headers["Content-Length"] = str(len(body))
+        await self._flush_start({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _flush_start(self, message: Message) -> None:
+        if self.start is not None:
+            await self._send(self.start)
+            self.start = None
+        await self._send(message)
@@ -11,15 +11,83 @@ class Settings(BaseSettings):
 
     # Base de données
     DATABASE_URL: str
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500
+    # Pool par processus : sous Passenger, le serveur voit jusqu'à
+    # nb de processus × (DB_POOL_SIZE + DB_MAX_OVERFLOW) connexions
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30          # attente max d'une connexion libre (s)
+    DB_POOL_RECYCLE: int = -1            # renouvellement des connexions (s, -1 = jamais)
+    DB_POOL_PRE_PING: bool = True
+    # Derrière PgBouncer (mode transaction) : pas de pool local (NullPool) ni de
+    # prepared statements réutilisés ; les réglages DB_POOL_* sont alors ignorés
+    DB_PGBOUNCER: bool = False
+    # Réplica en lecture (optionnel) pour les GET publics ; les écritures et /admin
+    # restent sur DATABASE_URL, qui sert aussi de repli si le réplica ne répond pas
+    DATABASE_READ_URL: str = ""
+    DATABASE_READ_CONNECT_TIMEOUT: float = 2
+    DATABASE_READ_RETRY_SECONDS: int = 30
+    DATABASE_READ_AFTER_WRITE_SECONDS: int = 5
 
     # JWT
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 480
+    # Utilisateur authentifié gardé en mémoire par jeton : délai max avant qu'une
+    # révocation faite dans un autre processus soit vue (0 = pas de cache)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    # Hachage bcrypt hors boucle asyncio : threads dédiés et file d'attente max
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32
 
     # Uploads
     UPLOAD_DIR: str = "uploads"
     MAX_FILE_SIZE_MB: int = 5
+    # Dérivés générés à l'upload (pool de processus) : largeurs WebP et qualités
+    IMAGE_WORKERS: int = 2
+    IMAGE_WIDTHS: str = "320,640,1024,1600"
+    IMAGE_WEBP_QUALITY: int = 80
+    IMAGE_JPEG_QUALITY: int = 85
+    # Redimensionnement à la demande (/uploads/<fichier>?w=&h=&fmt=) : tailles permises
+    # et cache disque des variantes, purgé (LRU par atime) au-delà du budget
+    IMAGE_RESIZE_SIZES: str = "160,320,480,640,800,1024,1280,1600,1920"
+    IMAGE_CACHE_DIR: str = "image_cache"
+    IMAGE_CACHE_MAX_MB: int = 512
+    # Service des fichiers : Cache-Control des noms non dérivés d'une empreinte, et
+    # délégation au serveur web frontal ("" | "x-accel-redirect" (nginx) | "x-sendfile" (Apache))
+    UPLOAD_CACHE_CONTROL: str = "public, max-age=86400"
+    UPLOAD_OFFLOAD: str = ""
+    UPLOAD_ACCEL_PREFIX: str = "/_internal/uploads/"
+    IMAGE_CACHE_ACCEL_PREFIX: str = "/_internal/image_cache/"
+
+    # Import en masse (/api/admin/import/…) : taille max du fichier reçu
+    IMPORT_MAX_MB: int = 512
+
+    # Caches mémoire (par processus) — durée de vie max entre deux processus Passenger
+    COUNT_CACHE_TTL_SECONDS: int = 60
+    RESPONSE_CACHE_TTL_SECONDS: int = 60
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1000
+    RESPONSE_CACHE_MAX_MB: int = 32
+    CATEGORY_REGISTRY_TTL_SECONDS: int = 60
+
+    # Compression des réponses (gzip, Brotli si le paquet est installé) au-delà de ce seuil.
+    # Les réponses mises en cache sont compressées une seule fois, d'où une qualité plus haute.
+    COMPRESSION_MIN_BYTES: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    COMPRESSION_BROTLI_QUALITY_CACHED: int = 9
+
+    # En-tête Cache-Control des contenus publics (revalidés ensuite par ETag / Last-Modified)
+    HTTP_CACHE_CONTROL: str = "public, max-age=60, stale-while-revalidate=300"
+
+    # Supervision : jeton Bearer exigé par GET /metrics (vide = point d'accès désactivé)
+    METRICS_TOKEN: str = ""
+    # Développement / préproduction (paramètres SQL journalisés en clair) :
+    # requêtes plus lentes que SLOW_QUERY_MS journalisées (0 = désactivé), et même requête
+    # exécutée NPLUS1_THRESHOLD fois dans une requête HTTP signalée — exception si NPLUS1_RAISE (tests)
+    SLOW_QUERY_MS: float = 0
+    NPLUS1_THRESHOLD: int = 0
+    NPLUS1_RAISE: bool = False
 
     # CORS
     ALLOWED_ORIGINS: str = "https://lamaisonbleuedejulien.org"
@@ -28,6 +96,14 @@ class Settings(BaseSettings):
     def allowed_origins_list(self) -> list[str]:
         return [o.strip() for o in self.ALLOWED_ORIGINS.split(",")]
 
+    @property
+    def image_widths_list(self) -> list[int]:
+        return sorted(int(w) for w in self.IMAGE_WIDTHS.split(",") if w.strip())
+
+    @property
+    def image_resize_sizes_set(self) -> set[int]:
+        return {int(s) for s in self.IMAGE_RESIZE_SIZES.split(",") if s.strip()}
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
@@ -0,0 +1,36 @@
+# core/counters.py
+
+from dataclasses import dataclass
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.cache import TTLCache, register
+from core.config import settings
+from core import statements
+
+
+@dataclass(frozen=True)
+class ListStats:
+    total: int
+    last_modified: datetime | None   # max(updated_at) — sert d'empreinte HTTP (ETag)
+
+
+# Totaux par (type de contenu, statut, catégorie) — évite un COUNT(*) par visiteur.
+# Invalidés par les handlers d'écriture ; le TTL borne l'écart entre processus.
+count_cache = register("counts", TTLCache(maxsize=512, ttl=settings.COUNT_CACHE_TTL_SECONDS))
+
+
+async def list_stats(
+    db: AsyncSession, model, filters: tuple, params: dict, cache_key: tuple | None = None,
+) -> ListStats:
+    """Totaux du filtre (cf. core.statements) ; mis en cache si cache_key est fourni."""
+    if cache_key is not None:
+        stats = count_cache.get(cache_key)
+        if stats is not None:
+            return stats
+
+    total, last_modified = (await db.execute(statements.list_stats(model, filters), params)).one()
+    stats = ListStats(total, last_modified)
+    if cache_key is not None:
+        count_cache.set(cache_key, stats)
+    return stats
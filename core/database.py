@@ -41,18 +41,178 @@
             
 # core/database.py
 
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+import time
+from dataclasses import dataclass, asdict
+from uuid import uuid4
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 from core.config import settings
 
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.APP_ENV == "development",
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+@dataclass
+class PoolStats:
+    checkouts: int = 0
+    checked_out: int = 0              # connexions prêtées en ce moment
+    connects: int = 0                 # connexions ouvertes vers le serveur
+    timeouts: int = 0                 # pool plein au-delà de DB_POOL_TIMEOUT
+    wait_seconds_total: float = 0.0   # obtention d'une connexion : file du pool + ouverture
+    wait_seconds_max: float = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def snapshot(self, pool) -> dict:
+        data = {"pool": type(pool).__name__, **asdict(self)}
+        if isinstance(pool, QueuePool):
+            data |= {"size": pool.size(), "checked_in": pool.checkedin(), "overflow": pool.overflow()}
+        return data
+
+
+class _TimedPool:
+    """Mesure le temps d'obtention d'une connexion (stats : attribut de la sous-classe par moteur)."""
+    stats: PoolStats
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        finally:
+            self.stats.record_wait(time.perf_counter() - start)
+
+
+# Moteurs et statistiques de leur pool, par nom (cf. database_stats)
+engines: dict[str, AsyncEngine] = {}
+pool_stats: dict[str, PoolStats] = {}
+
+
+def _pool_options() -> dict:
+    if settings.DB_PGBOUNCER:
+        # PgBouncer (mode transaction) tient le pool : une connexion par session, et
+        # aucun prepared statement réutilisé — le serveur change d'une transaction à l'autre
+        return {
+            "poolclass": NullPool,
+            "connect_args": {
+                "prepared_statement_cache_size": 0,
+                "statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            },
+        }
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        # Prepared statements asyncpg mis en cache par connexion (0 = désactivé)
+        "connect_args": {"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE},
+    }
+
+
+def make_engine(url: str, name: str, connect_args: dict | None = None) -> AsyncEngine:
+    """Moteur selon les réglages DB_* ; ses statistiques de pool sont publiées sous name."""
+    options = _pool_options()
+    options["connect_args"] |= connect_args or {}
+    stats = pool_stats[name] = PoolStats()
+    base = options["poolclass"]
+    options["poolclass"] = type(base.__name__, (_TimedPool, base), {"stats": stats})
+    engine = engines[name] = create_async_engine(url, echo=settings.APP_ENV == "development", **options)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def on_connect(*_):
+        stats.connects += 1
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def on_checkout(*_):
+        stats.checkouts += 1
+        stats.checked_out += 1
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def on_checkin(*_):
+        stats.checked_out -= 1
+
+    return engine
+
+
+def database_stats() -> dict:
+    return {name: pool_stats[name].snapshot(engine.pool) for name, engine in engines.items()}
+
+
+@dataclass
+class ReplicaState:
+    """
+    Routage des lectures publiques vers DATABASE_READ_URL. Un réplica injoignable est
+    écarté DATABASE_READ_RETRY_SECONDS ; après une écriture dans ce processus, les
+    lectures restent sur le primaire DATABASE_READ_AFTER_WRITE_SECONDS, le temps que
+    le réplica rattrape (sinon les caches de réponses garderaient l'ancienne version).
+    """
+    down_until: float = float("-inf")
+    last_write: float = float("-inf")
+    replica_sessions: int = 0
+    primary_sessions: int = 0
+    failures: int = 0               # connexions au réplica en échec
+    fallback_connections: int = 0   # connexions primaires ouvertes à sa place
+
+    @property
+    def down(self) -> bool:
+        return time.monotonic() < self.down_until
+
+    def trip(self) -> None:
+        self.failures += 1
+        self.down_until = time.monotonic() + settings.DATABASE_READ_RETRY_SECONDS
+
+    def use_replica(self) -> bool:
+        now = time.monotonic()
+        return now >= self.down_until and now - self.last_write >= settings.DATABASE_READ_AFTER_WRITE_SECONDS
+
+    def snapshot(self) -> dict:
+        return {"down": self.down, **{k: v for k, v in asdict(self).items() if k not in ("down_until", "last_write")}}
+
+
+replica_state = ReplicaState()
+
+
+def _fall_back_to(replica: AsyncEngine, primary: AsyncEngine) -> None:
+    """
+    Connexion du réplica impossible : la connexion est ouverte sur le primaire, la
+    requête en cours aboutit. Avec DB_POOL_PRE_PING, une connexion morte du pool est
+    détectée et rouverte ainsi ; une connexion de repli est remplacée au premier prêt
+    qui suit le retour du réplica.
+    """
+    cargs, cparams = primary.sync_engine.dialect.create_connect_args(primary.sync_engine.url)
+    cparams |= _pool_options()["connect_args"]
+
+    @event.listens_for(replica.sync_engine, "do_connect")
+    def connect(dialect, connection_record, replica_cargs, replica_cparams):
+        if not replica_state.down:
+            try:
+                return dialect.connect(*replica_cargs, **replica_cparams)
+            except Exception:
+                replica_state.trip()
+        replica_state.fallback_connections += 1
+        connection_record.info["fallback"] = True
+        return dialect.connect(*cargs, **cparams)
+
+    # Avant les compteurs de make_engine : une connexion écartée ici n'est pas comptée prêtée
+    @event.listens_for(replica.sync_engine, "checkout", insert=True)
+    def replace_fallback(dbapi_connection, connection_record, connection_proxy):
+        if connection_record.info.get("fallback") and not replica_state.down:
+            raise exc.DisconnectionError("réplica de nouveau disponible")
+
+
+engine = make_engine(settings.DATABASE_URL, "primary")
+read_engine = (
+    make_engine(settings.DATABASE_READ_URL, "replica", {"timeout": settings.DATABASE_READ_CONNECT_TIMEOUT})
+    if settings.DATABASE_READ_URL else None
 )
+if read_engine is not None:
+    _fall_back_to(read_engine, engine)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -61,19 +221,47 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
     autocommit=False,
 )
+ReadSessionLocal = AsyncSessionLocal if read_engine is None else async_sessionmaker(
+    bind=read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+    autocommit=False,
+)
 
 
 class Base(DeclarativeBase):
     pass
 
 
+def after_commit(db: AsyncSession, callback) -> None:
+    """Exécute callback() une fois la transaction de la requête validée (invalidation de caches)."""
+    db.info.setdefault("after_commit", []).append(callback)
+
+
 async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
         try:
             yield session
             await session.commit()
+            if callbacks := session.info.pop("after_commit", []):
+                replica_state.last_write = time.monotonic()
+            for callback in callbacks:
+                callback()
         except Exception:
             await session.rollback()
             raise
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+
+async def get_read_db() -> AsyncSession:
+    """Session des GET publics : réplica si configuré et disponible, sinon primaire. Jamais de commit."""
+    if read_engine is not None and replica_state.use_replica():
+        replica_state.replica_sessions += 1
+        factory = ReadSessionLocal
+    else:
+        replica_state.primary_sessions += 1
+        factory = AsyncSessionLocal
+    async with factory() as session:
+        yield session
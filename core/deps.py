@@ -1,21 +1,54 @@
 # core/deps.py
 
+import time
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Annotated
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
-from core.database import get_db
+from core.cache import TTLCache, register
+from core.config import settings
+from core.database import after_commit, get_db, get_read_db
 from core.security import decode_token
+from core.statements import by_id
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
+@dataclass(frozen=True)
+class Principal:
+    """Utilisateur authentifié, détaché de la session (mis en cache entre requêtes)."""
+    id: int
+    email: str
+    username: str
+    is_active: bool
+    is_admin: bool
+    created_at: datetime
+    token_version: int
+    expires_at: float   # exp du jeton (timestamp)
+
+
+# Clé : ("principal", jeton). Évite decode_token + SELECT users à chaque appel protégé.
+principal_cache = register("principals", TTLCache(maxsize=1024, ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS))
+
+
+def invalidate_principal(user_id: int) -> None:
+    """Oublie les jetons en cache d'un utilisateur (désactivation, changement de mot de passe…)."""
+    principal_cache.discard(lambda principal: principal.id == user_id)
+
+
+def revoke_tokens(db: AsyncSession, user) -> None:
+    """Invalide tous les jetons émis pour user (claim « ver ») ; effectif au commit."""
+    user.token_version += 1
+    after_commit(db, lambda: invalidate_principal(user.id))
+
+
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: Annotated[AsyncSession, Depends(get_db)],
-):
+) -> Principal:
     from models.user import User
 
     credentials_exception = HTTPException(
@@ -24,6 +57,10 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    principal = principal_cache.get(("principal", token))
+    if principal is not None and principal.expires_at > time.time():
+        return principal
+
     payload = decode_token(token)
     if payload is None:
         raise credentials_exception
@@ -32,15 +69,23 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
 
-    result = await db.execute(select(User).where(User.id == int(user_id)))
+    result = await db.execute(by_id(User), {"id": int(user_id)})
     user = result.scalar_one_or_none()
 
-    if user is None or not user.is_active:
+    # Jeton émis avant une révocation (les jetons sans « ver » datent d'avant la version 0)
+    if user is None or not user.is_active or payload.get("ver", 0) != user.token_version:
         raise credentials_exception
 
-    return user
+    principal = Principal(
+        id=user.id, email=user.email, username=user.username,
+        is_active=user.is_active, is_admin=user.is_admin, created_at=user.created_at,
+        token_version=user.token_version, expires_at=payload["exp"],
+    )
+    principal_cache.set(("principal", token), principal)
+    return principal
 
 
 # Raccourcis typés pour injection de dépendances
 DBDep = Annotated[AsyncSession, Depends(get_db)]
-CurrentUser = Annotated[object, Depends(get_current_user)]
\ No newline at end of file
+ReadDBDep = Annotated[AsyncSession, Depends(get_read_db)]   # GET publics (réplica éventuel)
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
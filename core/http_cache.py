@@ -0,0 +1,150 @@
+# core/http_cache.py
+
+import hashlib
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from core.cache import TTLCache, register
+from core.categories import category_registry
+from core.compression import compress, compression_stats, negotiate
+from core.config import settings
+from core.counters import ListStats
+
+
+@dataclass
+class Validators:
+    """Validateurs HTTP d'une représentation : ETag fort + Last-Modified éventuel."""
+    etag: str
+    last_modified: datetime | None = None
+
+    @classmethod
+    def from_parts(cls, *parts, last_modified: datetime | None = None) -> "Validators":
+        digest = hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()[:32]
+        return cls(f'"{digest}"', last_modified)
+
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": settings.HTTP_CACHE_CONTROL}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified.astimezone(timezone.utc), usegmt=True)
+        return headers
+
+
+# Les contenus embarquent leur catégorie : l'empreinte du registre entre dans les ETag,
+# un renommage de catégorie invalide donc les représentations déjà en cache client.
+
+def row_validators(id_: int, updated_at: datetime) -> Validators:
+    return Validators.from_parts(
+        id_, updated_at.isoformat(), category_registry.fingerprint, last_modified=updated_at,
+    )
+
+
+def list_validators(request: Request, stats: ListStats) -> Validators:
+    """Empreinte d'une page de liste : URL + nombre de lignes + max(updated_at) du filtre."""
+    return Validators.from_parts(
+        request.url.path, sorted(request.query_params.multi_items()),
+        stats.total, stats.last_modified and stats.last_modified.isoformat(),
+        category_registry.fingerprint,
+        last_modified=stats.last_modified,
+    )
+
+
+def is_conditional(request: Request) -> bool:
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def not_modified(request: Request, validators: Validators) -> Response | None:
+    """Réponse 304 si le client a déjà cette représentation, sinon None."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match prime sur If-Modified-Since (RFC 9110 §13.2.2)
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        fresh = "*" in tags or validators.etag in tags
+    else:
+        fresh = False
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since and validators.last_modified is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                since = None
+            if since is not None and since.tzinfo is not None:
+                fresh = validators.last_modified.replace(microsecond=0) <= since
+    return Response(status_code=304, headers=validators.headers()) if fresh else None
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+    validators: Validators | None = None
+    # Corps compressés par encodage, calculés à la première demande : une page chaude
+    # est compressée une fois par processus, pas à chaque requête
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def weight(self) -> int:
+        """Octets occupés dans response_cache : corps brut et corps compressés."""
+        return len(self.body) + sum(len(body) for body in self.encoded.values())
+
+    def to_response(self, request: Request) -> Response:
+        if self.validators is not None and (response := not_modified(request, self.validators)):
+            return response
+        if len(self.body) < settings.COMPRESSION_MIN_BYTES:
+            return Response(self.body, media_type="application/json", headers=self.headers)
+
+        headers = self.headers | {"Vary": "Accept-Encoding"}
+        encoding = negotiate(request.headers.get("accept-encoding", ""))
+        if encoding is None:
+            return Response(self.body, media_type="application/json", headers=headers)
+        if encoding in self.encoded:
+            compression_stats.memo_hits += 1
+        else:
+            self.encoded[encoding] = compress(self.body, encoding, cached=True)
+        return Response(
+            self.encoded[encoding], media_type="application/json",
+            headers=headers | {"Content-Encoding": encoding},
+        )
+
+
+# Réponses JSON déjà sérialisées des GET publics, clé = (type, chemin, query normalisée)
+response_cache = register("responses", TTLCache(
+    maxsize=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+    maxweight=settings.RESPONSE_CACHE_MAX_MB * 1024 * 1024,
+))
+
+
+def cache_key(namespace: str, request: Request) -> tuple:
+    return (namespace, request.url.path, tuple(sorted(request.query_params.multi_items())))
+
+
+def _respond(key: tuple, entry: CachedResponse, request: Request) -> Response:
+    response = entry.to_response(request)
+    # Un encodage compressé ajouté à l'entrée compte dans RESPONSE_CACHE_MAX_MB
+    response_cache.reweight(key, entry.weight)
+    return response
+
+
+def cached_response(namespace: str, request: Request) -> Response | None:
+    key = cache_key(namespace, request)
+    entry = response_cache.get(key)
+    return _respond(key, entry, request) if entry is not None else None
+
+
+def cache_response(
+    namespace: str, request: Request, content: BaseModel | bytes, validators: Validators | None = None,
+) -> Response:
+    """
+    Sérialise content (sauf s'il l'est déjà, cf. core.render), le met en cache et renvoie
+    la réponse (ou un 304). Sans validateurs fournis, l'ETag est l'empreinte du corps.
+    """
+    body = content if isinstance(content, bytes) else content.model_dump_json().encode()
+    if validators is None:
+        validators = Validators.from_parts(hashlib.sha1(body).hexdigest())
+    entry = CachedResponse(body, validators.headers(), validators)
+    key = cache_key(namespace, request)
+    response_cache.set(key, entry, weight=entry.weight)
+    return _respond(key, entry, request)
@@ -0,0 +1,153 @@
+# core/images.py
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from pathlib import Path
+from uuid import uuid4
+from PIL import Image, ImageOps
+
+from core.config import settings
+
+# Redimensionner / réencoder est du calcul pur qui garde le GIL : des processus
+# séparés ne bloquent ni la boucle asyncio ni les autres requêtes du worker.
+# « spawn » : pas de fork d'un processus qui tient déjà des connexions et des threads.
+# Créé au premier upload, donc dans le processus Passenger qui s'en sert.
+_executor: ProcessPoolExecutor | None = None
+
+
+def _pool() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.IMAGE_WORKERS, mp_context=get_context("spawn"),
+        )
+    return _executor
+
+
+async def run_in_pool(fn, *args):
+    global _executor
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_pool(), fn, *args)
+    except BrokenProcessPool:
+        # Un worker tué (mémoire, image piégée) rend tout le pool inutilisable :
+        # on le remplace pour les uploads suivants
+        shutdown_pool()
+        raise
+
+
+def shutdown_pool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+# Options d'enregistrement de l'original recompressé, par format Pillow
+ORIGINAL_OPTIONS = {
+    "JPEG": lambda q: {"quality": q, "optimize": True, "progressive": True},
+    "PNG": lambda q: {"optimize": True},
+    "WEBP": lambda q: {"quality": q, "method": 6},
+}
+
+
+def check_pixels(img: Image.Image) -> None:
+    """Refuse une image dont le décodage dépasserait Image.MAX_IMAGE_PIXELS.
+
+    Pillow ne lève DecompressionBombError qu'au-delà du double de la limite
+    (simple avertissement entre les deux) : la limite devient stricte ici.
+    """
+    if img.width * img.height > Image.MAX_IMAGE_PIXELS:
+        raise Image.DecompressionBombError(
+            f"{img.width}×{img.height} pixels (max {Image.MAX_IMAGE_PIXELS})"
+        )
+
+
+@dataclass
+class Derivatives:
+    width: int
+    height: int
+    variants: dict[int, str] = field(default_factory=dict)   # largeur → nom de fichier
+
+
+def _save(img: Image.Image, dest: Path, fmt: str, **options) -> None:
+    """Écrit à côté puis renomme : jamais de fichier partiel servi."""
+    tmp = dest.parent / ".tmp" / f"{uuid4().hex}.part"
+    try:
+        img.save(tmp, fmt, **options)
+        os.replace(tmp, dest)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def build_derivatives(
+    path: str, dest: str, widths: list[int], webp_quality: int, jpeg_quality: int,
+) -> Derivatives:
+    """Exécuté dans le pool : produit les WebP puis publie l'original sans EXIF en `dest`.
+
+    Les variantes sont nommées `<stem>-<largeur>.webp` à côté de l'original ;
+    seules les largeurs inférieures à l'original sont produites, plus une WebP
+    pleine largeur. L'original est écrit en dernier : sa présence garantit que
+    toutes ses variantes existent.
+    """
+    target = Path(dest)
+    with Image.open(path) as img:
+        check_pixels(img)
+        fmt = img.format
+        if getattr(img, "is_animated", False):
+            # GIF/WebP animés : publiés tels quels
+            os.replace(path, target)
+            return Derivatives(img.width, img.height)
+
+        icc = img.info.get("icc_profile")
+        # Appliquer l'orientation EXIF avant de la supprimer
+        img = ImageOps.exif_transpose(img)
+        if fmt == "JPEG" and img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+
+        result = Derivatives(img.width, img.height)
+        for width in _widths(widths, img.width):
+            height = max(1, round(img.height * width / img.width))
+            variant = img if width == img.width else img.resize((width, height), Image.LANCZOS)
+            name = f"{target.stem}-{width}.webp"
+            _save(variant, target.with_name(name), "WEBP", quality=webp_quality, method=4, icc_profile=icc)
+            result.variants[width] = name
+
+        # Original recompressé, métadonnées retirées (GPS, appareil…) sauf profil couleur
+        _save(img, target, fmt, icc_profile=icc, **ORIGINAL_OPTIONS.get(fmt, lambda q: {})(jpeg_quality))
+        return result
+
+
+def describe_derivatives(path: str, widths: list[int]) -> Derivatives:
+    """Dérivés d'un original déjà publié (lecture de l'en-tête seulement — bloquant)."""
+    target = Path(path)
+    with Image.open(target) as img:
+        result = Derivatives(img.width, img.height)
+        if getattr(img, "is_animated", False):
+            return result
+    for width in _widths(widths, result.width):
+        name = f"{target.stem}-{width}.webp"
+        if target.with_name(name).is_file():
+            result.variants[width] = name
+    return result
+
+
+def _widths(widths: list[int], original: int) -> list[int]:
+    return [w for w in widths if w < original] + [original]
+
+
+def render_variant(
+    path: str, dest: str, width: int | None, height: int | None, fmt: str, quality: int,
+) -> None:
+    """Exécuté dans le pool : réduit l'image dans la boîte width × height (sans agrandir)."""
+    with Image.open(path) as img:
+        check_pixels(img)
+        icc = img.info.get("icc_profile")
+        img = ImageOps.exif_transpose(img)
+        img.thumbnail((width or img.width, height or img.height), Image.LANCZOS)
+        if fmt == "JPEG" and img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        options = {"quality": quality} if fmt in ("JPEG", "WEBP") else {"optimize": True}
+        _save(img, Path(dest), fmt, icc_profile=icc, **options)
@@ -0,0 +1,270 @@
+# core/metrics.py
+
+"""
+Métriques du processus au format texte Prometheus (GET /metrics, cf. routers.metrics).
+
+- Latence des requêtes HTTP : histogramme par méthode, modèle de route
+  (« /api/articles/{slug} », jamais le chemin réel) et statut.
+- Requêtes SQL : nombre et durée par route (événements before/after_cursor_execute
+  de chaque moteur, rattachés à la requête HTTP en cours par une ContextVar) et
+  totaux par moteur, y compris hors requête (démarrage, flux d'export).
+- Pools de connexions et compteurs internes déjà publiés par /api/admin/stats.
+
+Tout est en mémoire et par processus : sous Passenger, chaque worker a ses propres
+séries. Le coût par requête se limite à quelques perf_counter() et incréments.
+"""
+
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.cache import caches
+from core.categories import category_registry
+from core.compression import compression_stats
+from core.database import database_stats, engines, read_engine, replica_state
+from core.security import password_hash_stats
+from core.variants import variant_stats
+
+# Bornes (s) de l'histogramme de latence — la dernière tranche est +Inf
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNMATCHED = "<unmatched>"   # 404 hors routes, fichiers du montage /uploads
+
+
+class Histogram:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.sum += value
+
+
+@dataclass
+class DBTotals:
+    queries: int = 0
+    seconds: float = 0.0
+    errors: int = 0      # requêtes en échec (comptées aussi dans queries et seconds)
+
+
+@dataclass
+class RequestStats:
+    """Requête HTTP en cours : le scope donne la route une fois le routage fait."""
+    scope: dict
+    queries: int = 0
+    db_seconds: float = 0.0
+    statements: dict[str, int] | None = None   # forme → exécutions (cf. core.querylog)
+
+    @property
+    def route(self) -> str:
+        route = self.scope.get("route")
+        return route.path if route is not None else UNMATCHED
+
+
+current_request: ContextVar[RequestStats | None] = ContextVar("current_request", default=None)
+
+# (méthode, route, statut) → latence ; (méthode, route) → SQL ; moteur → SQL
+http_latency: dict[tuple[str, str, str], Histogram] = {}
+db_by_route: dict[tuple[str, str], DBTotals] = {}
+db_by_engine: dict[str, DBTotals] = {}
+
+# Appelés après chaque requête SQL : (statement, parameters, executemany, durée, RequestStats | None).
+# Vide par défaut — rien de plus sur le chemin critique (cf. core.querylog)
+query_hooks: list = []
+
+
+# ── SQL ───────────────────────────────────────────────────────────────────────
+
+def instrument(engine, name: str) -> None:
+    totals = db_by_engine[name] = DBTotals()
+
+    # Début mémorisé sur le contexte d'exécution de la requête, propre à chacune :
+    # une requête en échec (sans after_cursor_execute) ne décale pas les suivantes
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context.metrics_start = time.perf_counter()
+
+    def record(context) -> float | None:
+        if (start := getattr(context, "metrics_start", None)) is None:
+            return None
+        del context.metrics_start
+        elapsed = time.perf_counter() - start
+        totals.queries += 1
+        totals.seconds += elapsed
+        # Le greenlet de SQLAlchemy reprend le contexte de la tâche : la ContextVar est visible ici
+        if (stats := current_request.get()) is not None:
+            stats.queries += 1
+            stats.db_seconds += elapsed
+        return elapsed
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after(conn, cursor, statement, parameters, context, executemany):
+        if (elapsed := record(context)) is not None:
+            for hook in query_hooks:
+                hook(statement, parameters, executemany, elapsed, current_request.get())
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def failed(exception_context):
+        if record(exception_context.execution_context) is not None:
+            totals.errors += 1
+
+
+for _name, _engine in engines.items():
+    instrument(_engine, _name)
+
+
+# ── HTTP ──────────────────────────────────────────────────────────────────────
+
+class MetricsMiddleware:
+    """Latence de bout en bout (corps en flux compris) et SQL par route. Le plus externe."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        stats = RequestStats(scope)
+        token = current_request.set(stats)
+        status = "500"   # exception avant l'envoi de l'en-tête
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            current_request.reset(token)
+            method, route = scope["method"], stats.route
+            key = (method, route, status)
+            if (histogram := http_latency.get(key)) is None:
+                histogram = http_latency[key] = Histogram()
+            histogram.observe(elapsed)
+            if stats.queries:
+                if (totals := db_by_route.get((method, route))) is None:
+                    totals = db_by_route[(method, route)] = DBTotals()
+                totals.queries += stats.queries
+                totals.seconds += stats.db_seconds
+
+
+# ── Compteurs internes ────────────────────────────────────────────────────────
+
+def process_stats() -> dict:
+    """Compteurs internes du processus (caches, hachage, images, compression, base)."""
+    return {
+        "caches": {name: cache.stats() for name, cache in caches.items()},
+        "category_registry": category_registry.stats(),
+        "password_hashing": password_hash_stats.snapshot(),
+        "image_variants": variant_stats.snapshot(),
+        "compression": compression_stats.snapshot(),
+        "database": database_stats(),
+        "read_replica": replica_state.snapshot() if read_engine is not None else None,
+    }
+
+
+# ── Format texte Prometheus ───────────────────────────────────────────────────
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+
+def _number(value) -> str | None:
+    """Valeur numérique d'une statistique ; None pour le texte (empreinte, classe de pool…)."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float)):
+        return repr(float(value)) if isinstance(value, float) else str(value)
+    return None
+
+
+class _Writer:
+    """Échantillons regroupés par métrique, comme l'exige le format texte."""
+
+    def __init__(self):
+        self.families: dict[str, list[str]] = {}
+
+    def family(self, name: str, kind: str, help: str) -> list[str]:
+        if (lines := self.families.get(name)) is None:
+            lines = self.families[name] = [f"# HELP {name} {help}", f"# TYPE {name} {kind}"]
+        return lines
+
+    def sample(self, name: str, kind: str, help: str, value, **labels) -> None:
+        if (number := _number(value)) is not None:
+            self.family(name, kind, help).append(f"{name}{_labels(**labels)} {number}")
+
+    def stats(self, prefix: str, data: dict, help: str, **labels) -> None:
+        for key, value in data.items():
+            self.sample(f"mbj_{prefix}_{key}", "untyped", f"{help} : {key}", value, **labels)
+
+    def text(self) -> str:
+        return "".join(line + "\n" for lines in self.families.values() for line in lines)
+
+
+# Groupes de process_stats publiés tels quels (préfixe mbj_<groupe>_<statistique>)
+GROUPS = {
+    "category_registry": "Registre des catégories",
+    "password_hashing": "Hachage des mots de passe",
+    "image_variants": "Variantes d'images",
+    "compression": "Compression des réponses",
+    "read_replica": "Réplica en lecture",
+}
+# Compteurs (croissants) des pools ; le reste de PoolStats.snapshot est une jauge
+POOL_COUNTERS = {"checkouts", "connects", "timeouts", "wait_seconds_total"}
+
+
+def render() -> str:
+    out = _Writer()
+
+    name = "mbj_http_request_duration_seconds"
+    lines = out.family(name, "histogram", "Durée des requêtes HTTP par route")
+    for (method, route, status), histogram in sorted(http_latency.items()):
+        labels = {"method": method, "route": route, "status": status}
+        cumulative = 0
+        for bound, count in zip((*BUCKETS, "+Inf"), histogram.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_labels(**labels, le=str(bound))} {cumulative}")
+        lines.append(f"{name}_sum{_labels(**labels)} {histogram.sum!r}")
+        lines.append(f"{name}_count{_labels(**labels)} {cumulative}")
+
+    for (method, route), totals in sorted(db_by_route.items()):
+        out.sample("mbj_http_db_queries_total", "counter", "Requêtes SQL exécutées pendant les requêtes HTTP",
+                   totals.queries, method=method, route=route)
+        out.sample("mbj_http_db_seconds_total", "counter", "Temps passé en base pendant les requêtes HTTP",
+                   totals.seconds, method=method, route=route)
+    for engine_name, totals in db_by_engine.items():
+        out.sample("mbj_db_queries_total", "counter", "Requêtes SQL exécutées par moteur",
+                   totals.queries, engine=engine_name)
+        out.sample("mbj_db_seconds_total", "counter", "Temps passé en base par moteur",
+                   totals.seconds, engine=engine_name)
+        out.sample("mbj_db_errors_total", "counter", "Requêtes SQL en échec par moteur",
+                   totals.errors, engine=engine_name)
+
+    stats = process_stats()
+    for engine_name, pool in stats.pop("database").items():
+        for key, value in pool.items():
+            out.sample(f"mbj_db_pool_{key}", "counter" if key in POOL_COUNTERS else "gauge",
+                       f"Pool de connexions : {key}", value, engine=engine_name)
+    for cache_name, cache in stats.pop("caches").items():
+        out.stats("cache", cache, "Cache mémoire", cache=cache_name)
+    for prefix, help in GROUPS.items():
+        if stats[prefix] is not None:
+            out.stats(prefix, stats[prefix], help)
+    return out.text()
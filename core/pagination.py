@@ -0,0 +1,61 @@
+# core/pagination.py
+
+import base64
+import json
+from datetime import datetime
+from fastapi import HTTPException
+from sqlalchemy import DateTime, Integer, bindparam, func, literal_column, tuple_
+
+# Pagination par curseur (keyset) sur (date, id) : le curseur est opaque pour
+# le client, il encode simplement la clé de tri du dernier élément renvoyé.
+
+# Date absente (colonne nullable) : triée après toutes les autres en DESC
+NO_DATE = literal_column("'-infinity'::timestamptz")
+
+
+def sort_date(col):
+    """
+    Clé de tri et de curseur d'une colonne de date : telle quelle si NOT NULL, sinon
+    coalesce(col, -infinity) — même expression que l'index keyset correspondant.
+    """
+    return func.coalesce(col, NO_DATE) if col.nullable else col
+
+
+def encode_cursor(at: datetime | None, id_: int) -> str:
+    raw = json.dumps([at.isoformat() if at is not None else None, id_], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime | None, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        at, id_ = json.loads(raw)
+        return datetime.fromisoformat(at) if at is not None else None, int(id_)
+    except (ValueError, TypeError):
+        raise HTTPException(400, "Curseur invalide")
+
+
+def keyset_before(date_col, id_col):
+    """Condition « après le curseur » pour un tri (sort_date DESC, id DESC) — cf. cursor_params."""
+    at = bindparam("cursor_at", type_=DateTime(timezone=True))
+    return tuple_(sort_date(date_col), id_col) < tuple_(
+        func.coalesce(at, NO_DATE) if date_col.nullable else at,
+        bindparam("cursor_id", type_=Integer),
+    )
+
+
+def cursor_params(cursor: str) -> dict:
+    at, id_ = decode_cursor(cursor)
+    return {"cursor_at": at, "cursor_id": id_}
+
+
+def next_cursor(rows: list, per_page: int, date_attr: str) -> str | None:
+    """rows provient d'un limit(per_page + 1) : None s'il n'y a pas de page suivante."""
+    if len(rows) <= per_page:
+        return None
+    last = rows[per_page - 1]
+    return encode_cursor(getattr(last, date_attr), last.id)
+
+
+def total_pages(total: int | None, per_page: int) -> int | None:
+    return None if total is None else max(1, -(-total // per_page))
@@ -0,0 +1,61 @@
+# core/querylog.py
+
+"""
+Journal des requêtes lentes et détection des N+1, branchés sur les événements SQL
+de core.metrics (query_hooks) seulement si SLOW_QUERY_MS / NPLUS1_THRESHOLD sont
+réglés : en production, aucun coût.
+
+La « forme » d'une requête est son texte SQL compilé : les valeurs passent en
+paramètres, donc N chargements paresseux d'une relation, ou N SELECT … WHERE id = $1
+dans une boucle, donnent N fois la même forme au cours d'une requête HTTP.
+"""
+
+import logging
+
+from core.config import settings
+from core.metrics import RequestStats, query_hooks
+
+logger = logging.getLogger(__name__)
+
+MAX_PARAMS_CHARS = 500
+
+
+class NPlusOneDetected(RuntimeError):
+    """Levée avec NPLUS1_RAISE (tests) : la même requête répétée dans une requête HTTP."""
+
+
+def _route(stats: RequestStats | None) -> str:
+    return f"{stats.scope['method']} {stats.route}" if stats is not None else "hors requête HTTP"
+
+
+def _params(parameters, executemany: bool) -> str:
+    text = f"{len(parameters)} lots" if executemany else repr(parameters)
+    return text if len(text) <= MAX_PARAMS_CHARS else text[:MAX_PARAMS_CHARS] + "…"
+
+
+def log_slow(statement: str, parameters, executemany: bool, elapsed: float, stats: RequestStats | None) -> None:
+    if elapsed * 1000 >= settings.SLOW_QUERY_MS:
+        logger.warning(
+            "Requête lente (%.1f ms) — %s\n%s\nparamètres : %s",
+            elapsed * 1000, _route(stats), statement, _params(parameters, executemany),
+        )
+
+
+def detect_repeats(statement: str, parameters, executemany: bool, elapsed: float, stats: RequestStats | None) -> None:
+    if stats is None:
+        return
+    if stats.statements is None:
+        stats.statements = {}
+    count = stats.statements[statement] = stats.statements.get(statement, 0) + 1
+    if count != settings.NPLUS1_THRESHOLD:
+        return   # signalée une seule fois par forme et par requête HTTP
+    message = f"N+1 probable : {count} exécutions de la même requête — {_route(stats)}\n{statement}"
+    if settings.NPLUS1_RAISE:
+        raise NPlusOneDetected(message)
+    logger.warning(message)
+
+
+if settings.SLOW_QUERY_MS > 0:
+    query_hooks.append(log_slow)
+if settings.NPLUS1_THRESHOLD > 0:
+    query_hooks.append(detect_repeats)
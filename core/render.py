@@ -0,0 +1,127 @@
+# core/render.py
+
+import types
+import typing
+from decimal import Decimal
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Literal
+
+import orjson
+from fastapi import HTTPException, Response
+from pydantic import BaseModel, RootModel, create_model
+
+ListView = Literal["full", "summary"]
+
+# Sortie identique à model_dump_json() : datetimes UTC en « Z », Decimal en chaîne
+OPTIONS = orjson.OPT_UTC_Z
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError
+
+
+def _converter(annotation: Any) -> Callable[[Any], Any] | None:
+    """Conversion d'une valeur selon son annotation : None si la valeur passe telle quelle."""
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        inner = _converter(args[0]) if len(args) == 1 else None
+        return (lambda v: None if v is None else inner(v)) if inner else None
+    if origin is list:
+        inner = _converter(typing.get_args(annotation)[0])
+        return (lambda v: [inner(x) for x in v]) if inner else list
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return compile_schema(annotation)
+    return None
+
+
+@lru_cache(maxsize=1024)
+def compile_schema(schema: type[BaseModel]) -> Callable[[Any], Any]:
+    """
+    Fonction objet → dict qui lit les attributs déclarés par le schéma, sans validation :
+    pour des données déjà sûres (lignes ORM) sérialisées selon les schémas de schemas/*.py.
+    """
+    if issubclass(schema, RootModel):
+        return _converter(schema.model_fields["root"].annotation) or (lambda v: v)
+
+    names = tuple(schema.model_fields)
+    getter = attrgetter(*names) if len(names) > 1 else (lambda obj, get=attrgetter(*names): (get(obj),))
+    nested = [
+        (name, conv) for name, field in schema.model_fields.items()
+        if (conv := _converter(field.annotation)) is not None
+    ]
+
+    def convert(obj: Any) -> dict:
+        data = dict(zip(names, getter(obj)))
+        for name, conv in nested:
+            data[name] = conv(data[name])
+        return data
+
+    return convert
+
+
+@lru_cache(maxsize=None)
+def _defaults(schema: type[BaseModel]) -> dict[str, Any]:
+    return {name: field.default for name, field in schema.model_fields.items() if not field.is_required()}
+
+
+def dumps(value: Any, option: int = 0) -> bytes:
+    """orjson avec les conventions de sortie de l'API (UTC en « Z », Decimal en chaîne)."""
+    return orjson.dumps(value, default=_default, option=OPTIONS | option)
+
+
+def render(schema: type[BaseModel], obj: Any = None, /, **fields) -> bytes:
+    """
+    JSON d'obj (ou des champs nommés, pour une enveloppe de liste) selon schema, en une passe.
+    Les handlers gardent response_model=schema pour la documentation OpenAPI.
+    """
+    if fields:
+        obj = types.SimpleNamespace(**(_defaults(schema) | fields))
+    return dumps(compile_schema(schema)(obj))
+
+
+def render_response(schema: type[BaseModel], obj: Any = None, /, **fields) -> Response:
+    return Response(render(schema, obj, **fields), media_type="application/json")
+
+
+# ── Projections des listes : résumé (sans content) ou champs choisis (?fields=) ──
+
+def _items_schema(list_schema: type[BaseModel]) -> type[BaseModel]:
+    return typing.get_args(list_schema.model_fields["items"].annotation)[0]
+
+
+@lru_cache(maxsize=256)
+def _subset(schema: type[BaseModel], names: tuple[str, ...]) -> type[BaseModel]:
+    return create_model(
+        f"{schema.__name__}Fields", **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in names},
+    )
+
+
+@lru_cache(maxsize=256)
+def page_schema(list_schema: type[BaseModel], item_schema: type[BaseModel]) -> type[BaseModel]:
+    return create_model(f"{list_schema.__name__}Fields", __base__=list_schema, items=(list[item_schema], ...))
+
+
+def sparse_schema(schema: type[BaseModel], fields: str) -> type[BaseModel]:
+    """Sous-schéma limité aux champs demandés (« id,title,slug »), dans l'ordre du schéma."""
+    names = {f.strip() for f in fields.split(",") if f.strip()}
+    if unknown := names - schema.model_fields.keys():
+        raise HTTPException(400, f"Champs inconnus : {', '.join(sorted(unknown))}")
+    if not names:
+        raise HTTPException(400, "Aucun champ demandé")
+    return _subset(schema, tuple(name for name in schema.model_fields if name in names))
+
+
+def list_projection(
+    list_schema: type[BaseModel], summary_schema: type[BaseModel], view: ListView, fields: str | None,
+) -> tuple[type[BaseModel], tuple[str, ...] | None]:
+    """Schéma de page à rendre et champs à charger (None : entité complète)."""
+    if fields:
+        item_schema = sparse_schema(_items_schema(list_schema), fields)
+        return page_schema(list_schema, item_schema), tuple(item_schema.model_fields)
+    if view == "summary":
+        return summary_schema, tuple(_items_schema(summary_schema).model_fields)
+    return list_schema, None
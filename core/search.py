@@ -0,0 +1,33 @@
+# core/search.py
+
+from typing import Literal
+from sqlalchemy import func, literal_column
+
+# Configuration Postgres utilisée par les colonnes search_vector (cf. migrations)
+FTS_CONFIG = "french"
+
+# Ordre des résultats de recherche publique
+SortOrder = Literal["relevance", "date"]
+
+_config = literal_column(f"'{FTS_CONFIG}'::regconfig")
+
+
+def ts_query(term: str):
+    """Requête tsquery à partir de la saisie libre (guillemets, OR, -exclusion)."""
+    return func.websearch_to_tsquery(_config, term)
+
+
+def ts_match(vector, term: str):
+    return vector.op("@@")(ts_query(term))
+
+
+def ts_rank(vector, term: str):
+    return func.ts_rank(vector, ts_query(term))
+
+
+def ts_vector_sql(*weighted: tuple[str, str]) -> str:
+    """Expression SQL de la colonne générée : [("title", "A"), ("content", "C")]."""
+    return " || ".join(
+        f"setweight(to_tsvector('{FTS_CONFIG}', coalesce({col}, '')), '{weight}')"
+        for col, weight in weighted
+    )
@@ -1,12 +1,39 @@
 # core/security.py
 
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta, timezone
+from fastapi import HTTPException
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from core.config import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt (~250 ms par appel) libère le GIL : un pool de threads dédié et borné le
+# sort de la boucle asyncio, un afflux de connexions ne ralentit que /login.
+password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt",
+)
+
+
+@dataclass
+class PasswordHashStats:
+    calls: int = 0
+    rejected: int = 0        # refusés (file d'attente pleine)
+    pending: int = 0         # en cours ou en attente d'un thread
+    queue_seconds_total: float = 0.0
+    queue_seconds_max: float = 0.0
+    hash_seconds_total: float = 0.0
+
+    def snapshot(self) -> dict:
+        return asdict(self)
+
+
+password_hash_stats = PasswordHashStats()
+
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -16,6 +43,40 @@ def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
 
+async def _run_hashing(fn, *args):
+    stats = password_hash_stats
+    if stats.pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        stats.rejected += 1
+        raise HTTPException(503, "Trop de connexions simultanées, réessayez", headers={"Retry-After": "1"})
+
+    submitted = time.perf_counter()
+
+    def timed():
+        started = time.perf_counter()
+        return started, fn(*args), time.perf_counter()
+
+    stats.pending += 1
+    try:
+        started, result, finished = await asyncio.get_running_loop().run_in_executor(password_executor, timed)
+    finally:
+        stats.pending -= 1
+
+    queued = started - submitted
+    stats.calls += 1
+    stats.queue_seconds_total += queued
+    stats.queue_seconds_max = max(stats.queue_seconds_max, queued)
+    stats.hash_seconds_total += finished - started
+    return result
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_hashing(hash_password, password)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await _run_hashing(verify_password, plain, hashed)
+
+
 def create_access_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(
@@ -29,4 +90,4 @@ def decode_token(token: str) -> dict | None:
     try:
         return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
     except JWTError:
-        return None
\ No newline at end of file
+        return None
@@ -0,0 +1,79 @@
+# core/slugs.py
+
+import re
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.statements import slug_usage, slugs_usage
+
+MAX_ATTEMPTS = 10
+
+
+def _like_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+async def next_free_slug(db: AsyncSession, model, base: str) -> str:
+    """Un seul SELECT : base si libre, sinon base-N avec N = plus grand suffixe existant + 1."""
+    taken, max_suffix = (await db.execute(slug_usage(model), {
+        "base": base,
+        "pattern": f"{_like_escape(base)}-%",
+        "suffix_re": f"^{re.escape(base)}-([0-9]{{1,15}})$",
+    })).one()
+    if not taken:
+        return base
+    return f"{base}-{(max_suffix or 0) + 1}"
+
+
+async def free_slugs(db: AsyncSession, model, bases: list[str]) -> list[str]:
+    """
+    next_free_slug pour toute une liste en un SELECT : une base répétée dans la liste
+    reçoit base, base-N, base-N+1… (ni pris en base, ni déjà attribué dans la liste).
+    """
+    distinct = list(dict.fromkeys(bases))
+    usage = {
+        base: (taken, max_suffix or 0)
+        for base, taken, max_suffix in await db.execute(slugs_usage(model), {
+            "bases": distinct,
+            "suffix_res": [f"^{re.escape(base)}-([0-9]{{1,15}})$" for base in distinct],
+        })
+    }
+    used = set()
+    slugs = []
+    for base in bases:
+        taken, suffix = usage[base]
+        slug = base
+        while taken or slug in used:
+            taken, suffix = False, suffix + 1
+            slug = f"{base}-{suffix}"
+        usage[base] = (True, suffix)
+        used.add(slug)
+        slugs.append(slug)
+    return slugs
+
+
+def is_slug_conflict(exc: IntegrityError, model) -> bool:
+    """Violation de l'index unique du slug de model (et non NOT NULL, CHECK… sur la colonne)."""
+    orig = exc.orig.__cause__ or exc.orig   # exception asyncpg sous l'enveloppe du pilote
+    unique = {ix.name for ix in model.__table__.indexes if ix.unique and [c.key for c in ix.columns] == ["slug"]}
+    return getattr(orig, "sqlstate", None) == "23505" and getattr(orig, "constraint_name", None) in unique
+
+
+async def add_with_slug(db: AsyncSession, instance, base: str):
+    """
+    Ajoute instance avec le premier slug libre dérivé de base.
+    Deux créations concurrentes peuvent viser le même slug : l'index unique
+    tranche, et la perdante recommence dans un SAVEPOINT sans annuler la requête.
+    """
+    model = type(instance)
+    for _ in range(MAX_ATTEMPTS):
+        instance.slug = await next_free_slug(db, model, base)
+        try:
+            async with db.begin_nested():
+                db.add(instance)
+            return instance
+        except IntegrityError as exc:
+            if not is_slug_conflict(exc, model):
+                raise
+    raise HTTPException(409, f"Impossible d'attribuer un slug libre pour '{base}', réessayez")
@@ -0,0 +1,172 @@
+# core/statements.py
+
+"""
+Registre des requêtes des chemins chauds (lookup par slug / id, listes, totaux).
+
+Chaque forme de requête — filtres présents ou non, tri, curseur — est construite
+une seule fois avec des bindparam, et les valeurs passent en paramètres
+d'exécution. SQLAlchemy réutilise alors la clé de cache mémorisée et la
+compilation, et asyncpg son prepared statement (texte SQL identique).
+
+Les relations (category, author) sont en lazy="raise_on_sql" : chaque requête
+déclare leur chargement — jointure pour une ligne, selectinload pour une page,
+rien pour les totaux, existences et révalidations. La catégorie n'est jamais
+chargée en SQL : elle vient du registre en mémoire (core.categories).
+"""
+
+from functools import lru_cache
+from sqlalchemy import ARRAY, BigInteger, String, and_, bindparam, cast, func, inspect, literal_column, or_, select
+from sqlalchemy.orm import joinedload, load_only, selectinload
+
+from core.pagination import keyset_before, sort_date
+from core.search import ts_match, ts_rank
+
+SEARCH = bindparam("search", type_=String)
+
+# Relations résolues hors SQL, par core.categories.category_registry.attach
+REGISTRY_RELATIONS = frozenset({"category"})
+
+
+def is_published(model):
+    # Littéral (et non paramètre) pour que Postgres utilise l'index partiel des publiés
+    return model.status == literal_column("'published'")
+
+
+def related(model, strategy=joinedload, only: tuple[str, ...] | None = None) -> list:
+    """Options de chargement des relations du modèle (toutes, ou celles de only), hors registre."""
+    return [
+        strategy(getattr(model, rel.key)) for rel in inspect(model).relationships
+        if rel.key not in REGISTRY_RELATIONS and (only is None or rel.key in only)
+    ]
+
+
+@lru_cache(maxsize=None)
+def by_id(model, with_related: bool = True):
+    """Ligne par id, auteur joint (with_related=False : suppression, existence)."""
+    q = select(model).where(model.id == bindparam("id"))
+    return q.options(*related(model)) if with_related else q
+
+
+@lru_cache(maxsize=None)
+def by_slug(model):
+    """Contenu publié par slug, auteur joint — paramètre : slug."""
+    return select(model).where(model.slug == bindparam("slug"), is_published(model)).options(*related(model))
+
+
+@lru_cache(maxsize=None)
+def version_by_slug(model):
+    """(id, updated_at) d'un contenu publié, pour revalider sans charger le contenu."""
+    return select(model.id, model.updated_at).where(model.slug == bindparam("slug"), is_published(model))
+
+
+@lru_cache(maxsize=None)
+def public_filters(model, category: bool, search: bool) -> tuple:
+    """Paramètres : category_id (slug résolu par le registre des catégories), search."""
+    filters = [is_published(model)]
+    if category:
+        filters.append(model.category_id == bindparam("category_id"))
+    if search:
+        filters.append(ts_match(model.search_vector, SEARCH))
+    return tuple(filters)
+
+
+@lru_cache(maxsize=None)
+def admin_filters(model, search_col: str, status: bool, search: bool) -> tuple:
+    """Paramètres : status, pattern (ILIKE sur search_col)."""
+    filters = []
+    if status:
+        filters.append(model.status == bindparam("status"))
+    if search:
+        filters.append(getattr(model, search_col).ilike(bindparam("pattern")))
+    return tuple(filters)
+
+
+def load_fields(model, fields: tuple[str, ...]) -> list:
+    """
+    Options de chargement limitées aux champs d'un schéma : colonnes via load_only,
+    relations demandées en selectinload (avec leur clé étrangère), les autres jamais chargées.
+    """
+    mapper = inspect(model)
+    columns = {name for name in fields if name in mapper.column_attrs}
+    for rel in mapper.relationships:
+        if rel.key in fields:
+            columns.update(c.key for c in rel.local_columns)
+    return [
+        load_only(*(getattr(model, name) for name in sorted(columns))),
+        *related(model, selectinload, fields),
+    ]
+
+
+@lru_cache(maxsize=512)
+def list_page(
+    model, date_col: str, filters: tuple, by_rank: bool = False, cursor: bool = False,
+    fields: tuple[str, ...] | None = None,
+):
+    """
+    Page triée (date DESC, id DESC ; date absente en dernier, cf. sort_date) ou par pertinence —
+    paramètres : limit + offset ou curseur.
+    Auteur en selectinload : une requête IN plutôt qu'une jointure par ligne (catégorie : registre).
+    fields : ne charger que ces champs (+ la date du curseur), cf. core.render.list_projection.
+    """
+    column, id_ = model.__table__.c[date_col], model.id
+    date = sort_date(column)
+    q = select(model).where(*filters)
+    if fields is not None:
+        q = q.options(*load_fields(model, fields + (date_col,)))
+    else:
+        q = q.options(*related(model, selectinload))
+    if by_rank:
+        q = q.order_by(ts_rank(model.search_vector, SEARCH).desc(), date.desc(), id_.desc())
+    else:
+        q = q.order_by(date.desc(), id_.desc())
+    if cursor:
+        q = q.where(keyset_before(column, id_))
+    else:
+        q = q.offset(bindparam("offset"))
+    return q.limit(bindparam("limit"))
+
+
+@lru_cache(maxsize=None)
+def list_stats(model, filters: tuple):
+    """COUNT(*) et max(updated_at) sans jointure sur les relations."""
+    return select(func.count(), func.max(model.updated_at)).select_from(model).where(*filters)
+
+
+@lru_cache(maxsize=None)
+def slug_usage(model):
+    """
+    Le slug de base est-il pris, et plus grand suffixe numérique « base-N » —
+    paramètres : base, pattern (LIKE 'base-%'), suffix_re (capture de N).
+    """
+    base = bindparam("base", type_=String)
+    suffix = func.substring(model.slug, bindparam("suffix_re", type_=String))
+    return select(
+        func.count().filter(model.slug == base),
+        func.max(cast(suffix, BigInteger)),
+    ).where(or_(model.slug == base, model.slug.like(bindparam("pattern", type_=String))))
+
+
+@lru_cache(maxsize=None)
+def slugs_usage(model):
+    """
+    slug_usage pour plusieurs bases en une requête (créations groupées) — paramètres :
+    tableaux parallèles bases et suffix_res. Une ligne (base, pris, plus grand N) par base.
+    Les « base-N » sont cherchés par intervalle [base-, base.) en opérateurs octet à octet,
+    servis par l'index varchar_pattern_ops quelle que soit la base.
+    """
+    wanted = func.unnest(
+        bindparam("bases", type_=ARRAY(String)), bindparam("suffix_res", type_=ARRAY(String)),
+    ).table_valued("base", "suffix_re").render_derived(name="wanted")
+    base = wanted.c.base
+    suffix = func.substring(model.slug, wanted.c.suffix_re)
+    return select(
+        base,
+        func.count(model.id).filter(model.slug == base),
+        func.max(cast(suffix, BigInteger)),
+    ).select_from(wanted).outerjoin(model, or_(
+        model.slug == base,
+        and_(
+            model.slug.op("~>=~", is_comparison=True)((base + "-").self_group()),
+            model.slug.op("~<~", is_comparison=True)((base + ".").self_group()),
+        ),
+    )).group_by(base)
@@ -0,0 +1,108 @@
+# core/static.py
+
+import mimetypes
+import os
+import re
+from email.utils import parsedate
+from pathlib import Path
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+from core.config import settings
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+# Noms dérivés d'une empreinte sha256 (original, <hash>-<largeur>.webp, variantes du cache) :
+# leur contenu ne change jamais
+CONTENT_NAMED = re.compile(r"^[0-9a-f]{64}[-.]")
+# Types pour lesquels un .br / .gz précompressé peut exister à côté du fichier
+COMPRESSIBLE = ("text/", "image/svg+xml", "application/json", "application/javascript")
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+
+class UploadFileResponse(FileResponse):
+    """FileResponse qui laisse le serveur envoyer le fichier quand il le propose
+    (extensions ASGI pathsend / zerocopysend) ; les Range restent gérés par Starlette."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.extensions = scope.get("extensions") or {}
+        await super().__call__(scope, receive, send)
+
+    async def _handle_simple(self, send: Send, send_header_only: bool) -> None:
+        if send_header_only:
+            return await super()._handle_simple(send, send_header_only)
+        if "http.response.pathsend" in self.extensions:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            await send({"type": "http.response.pathsend", "path": os.path.abspath(self.path)})
+        elif "http.response.zerocopysend" in self.extensions:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            with open(self.path, "rb") as file:
+                await send({"type": "http.response.zerocopysend", "file": file, "count": self.stat_result.st_size})
+        else:
+            await super()._handle_simple(send, send_header_only)
+
+
+def cache_control(name: str) -> str:
+    return IMMUTABLE if CONTENT_NAMED.match(name) else settings.UPLOAD_CACHE_CONTROL
+
+
+def _accepted_encodings(request_headers: Headers) -> set[str]:
+    return {e.split(";")[0].strip() for e in request_headers.get("accept-encoding", "").split(",")}
+
+
+def _is_not_modified(response_headers: Headers, request_headers: Headers) -> bool:
+    # Mêmes règles que StaticFiles : If-None-Match prime sur If-Modified-Since
+    if if_none_match := request_headers.get("if-none-match"):
+        return response_headers["etag"] in [tag.strip(" W/") for tag in if_none_match.split(",")]
+    if if_modified_since := parsedate(request_headers.get("if-modified-since", "")):
+        last_modified = parsedate(response_headers["last-modified"])
+        return last_modified is not None and if_modified_since >= last_modified
+    return False
+
+
+def serve_file(
+    scope: Scope, path: Path, stat_result: os.stat_result | None = None, accel_uri: str | None = None,
+) -> Response:
+    """
+    Réponse pour un fichier d'upload ou une variante : Cache-Control immuable pour les
+    noms à empreinte, 304, Range, .br/.gz précompressés, ou délégation au frontal
+    (X-Accel-Redirect vers accel_uri, X-Sendfile) selon UPLOAD_OFFLOAD.
+    """
+    request_headers = Headers(scope=scope)
+    headers = {"cache-control": cache_control(path.name)}
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+
+    # Le frontal envoie les octets (et gère lui-même 304 / Range) : le worker est libéré
+    if settings.UPLOAD_OFFLOAD == "x-accel-redirect" and accel_uri:
+        return Response(headers=headers | {"x-accel-redirect": accel_uri}, media_type=media_type)
+    if settings.UPLOAD_OFFLOAD == "x-sendfile":
+        return Response(headers=headers | {"x-sendfile": str(path.resolve())}, media_type=media_type)
+
+    if media_type.startswith(COMPRESSIBLE):
+        headers["vary"] = "Accept-Encoding"
+        accepted = _accepted_encodings(request_headers)
+        for encoding, suffix in PRECOMPRESSED:
+            candidate = path.with_name(path.name + suffix)
+            if encoding in accepted and candidate.is_file():
+                headers["content-encoding"] = encoding
+                path, stat_result = candidate, None
+                break
+
+    response = UploadFileResponse(
+        path, headers=headers, media_type=media_type, stat_result=stat_result or os.stat(path),
+    )
+    if _is_not_modified(response.headers, request_headers):
+        return NotModifiedResponse(response.headers)
+    return response
+
+
+class UploadStaticFiles(StaticFiles):
+    """Montage /uploads (sous-dossiers) servi avec les mêmes en-têtes que routers/media.py."""
+
+    def file_response(
+        self, full_path, stat_result: os.stat_result, scope: Scope, status_code: int = 200,
+    ) -> Response:
+        path = Path(full_path)
+        relative = path.relative_to(Path(self.directory).resolve()).as_posix()
+        return serve_file(scope, path, stat_result, settings.UPLOAD_ACCEL_PREFIX + relative)
@@ -0,0 +1,286 @@
+# core/transfer.py
+
+"""
+Export et import en masse des contenus et des catégories (sauvegardes, migrations).
+
+Export : NDJSON ou CSV produit au fil d'un curseur serveur (yield_per), dans une
+transaction REPEATABLE READ en lecture seule : instantané cohérent même pendant
+des modifications, mémoire constante quelle que soit la taille de la table.
+
+Import : corps de la requête recopié dans un fichier temporaire (la transaction
+n'attend pas un client lent), puis COPY binaire asyncpg vers une table temporaire
+et un seul INSERT … SELECT … ON CONFLICT (slug) DO UPDATE vers la table cible.
+La catégorie d'un contenu est désignée par son slug (les id diffèrent d'une base
+à l'autre) ; les colonnes id et author_id d'un export sont ignorées, les nouveaux
+contenus sont attribués à l'auteur de l'import.
+"""
+
+import asyncio
+import csv
+import io
+import os
+import tempfile
+from datetime import datetime, timezone
+from decimal import Decimal
+from itertools import islice
+from typing import AsyncIterator, Iterator, Literal
+
+import aiofiles
+import asyncpg
+import orjson
+from fastapi import HTTPException, Request
+from sqlalchemy import Boolean, DateTime, Numeric, case, column, func, literal, literal_column, select, table, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.database import AsyncSessionLocal
+from core.render import dumps
+from models.article import Article
+from models.boutique import BoutiqueItem
+from models.category import Category
+from models.publication import Publication
+
+TransferKind = Literal["articles", "publications", "boutique", "categories"]
+TransferFormat = Literal["ndjson", "csv"]
+
+MODELS = {"articles": Article, "publications": Publication, "boutique": BoutiqueItem, "categories": Category}
+# Espace de noms des caches (cf. core.cache.invalidate)
+NAMESPACES = {"articles": "article", "publications": "publication", "boutique": "boutique", "categories": "category"}
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+BATCH_ROWS = 1000
+MAX_BYTES = settings.IMPORT_MAX_MB * 1024 * 1024
+STAGING = "import_staging"
+
+# Jamais transférées : colonne générée, et clé étrangère remplacée par category_slug
+SKIPPED = frozenset({"search_vector", "category_id"})
+# Propres à la base d'origine : exportées pour référence, ignorées à l'import
+LOCAL = frozenset({"id", "author_id"})
+
+
+def _has_category(model) -> bool:
+    return "category_id" in model.__table__.c
+
+
+# ── Export ────────────────────────────────────────────────────────────────────
+
+def export_query(model):
+    columns = [c for c in model.__table__.c if c.key not in SKIPPED]
+    q = select(*columns)
+    if _has_category(model):
+        q = q.add_columns(Category.slug.label("category_slug")).outerjoin(
+            Category, Category.id == model.category_id,
+        )
+    return q.order_by(model.id)
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _encode(fmt: TransferFormat, names: list[str], rows) -> bytes:
+    if fmt == "ndjson":
+        return b"".join(dumps(dict(zip(names, row)), orjson.OPT_APPEND_NEWLINE) for row in rows)
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows([_csv_value(v) for v in row] for row in rows)
+    return buffer.getvalue().encode()
+
+
+async def export_rows(model, fmt: TransferFormat) -> AsyncIterator[bytes]:
+    """Corps d'une StreamingResponse : session propre, le flux survivant au handler."""
+    q = export_query(model).execution_options(yield_per=BATCH_ROWS)
+    names = list(q.selected_columns.keys())
+    async with AsyncSessionLocal() as db:
+        await db.connection(execution_options={"isolation_level": "REPEATABLE READ", "postgresql_readonly": True})
+        result = await db.stream(q)
+        if fmt == "csv":
+            yield _encode(fmt, [], [names])
+        async for rows in result.partitions():
+            yield _encode(fmt, names, rows)
+
+
+# ── Import ────────────────────────────────────────────────────────────────────
+
+def import_columns(model) -> list:
+    return [c for c in model.__table__.c if c.key not in SKIPPED | LOCAL]
+
+
+def _bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    try:
+        return {"true": True, "false": False, "1": True, "0": False}[str(value).lower()]
+    except KeyError:
+        raise ValueError(f"booléen invalide : {value!r}") from None
+
+
+def _datetime(value) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _converter(col):
+    if isinstance(col.type, Boolean):
+        return _bool
+    if isinstance(col.type, DateTime):
+        return _datetime
+    if isinstance(col.type, Numeric):
+        return lambda v: Decimal(str(v))
+    return lambda v: v if isinstance(v, str) else str(v)
+
+
+def _default(col):
+    """Défaut Python de la colonne (valeur ou fonction sans argument), pour les champs absents."""
+    if col.default is None:
+        return None
+    arg = col.default.arg
+    return (lambda: arg(None)) if col.default.is_callable else (lambda: arg)
+
+
+def _records(model, source: Iterator[tuple[int, dict]]) -> Iterator[tuple]:
+    """Lignes du COPY : colonnes importées (+ category_slug), puis numéro de ligne."""
+    columns = [(c.key, _converter(c), _default(c)) for c in import_columns(model)]
+    category = _has_category(model)
+    for line, item in source:
+        if not item.get("slug"):
+            raise ValueError(f"ligne {line} : slug manquant")
+        record = []
+        for name, convert, default in columns:
+            value = item.get(name)
+            if value is None:
+                record.append(default() if default else None)
+                continue
+            try:
+                record.append(convert(value))
+            except (ValueError, ArithmeticError) as exc:
+                raise ValueError(f"ligne {line}, {name} : {exc}") from None
+        if category:
+            record.append(item.get("category_slug") or None)
+        record.append(line)
+        yield tuple(record)
+
+
+def _ndjson(file) -> Iterator[tuple[int, dict]]:
+    for line, raw in enumerate(file, 1):
+        if raw.strip():
+            try:
+                yield line, orjson.loads(raw)
+            except orjson.JSONDecodeError as exc:
+                raise ValueError(f"ligne {line} : JSON invalide ({exc})") from None
+
+
+def _csv(file) -> Iterator[tuple[int, dict]]:
+    reader = csv.DictReader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+    for item in reader:
+        # Pas de NULL en CSV : champ vide = absent
+        yield reader.line_num, {name: value or None for name, value in item.items()}
+
+
+async def spool(request: Request) -> str:
+    """Corps de la requête → fichier temporaire (chemin), arrêt dès IMPORT_MAX_MB."""
+    fd, path = tempfile.mkstemp(prefix="import-", suffix=".part")
+    os.close(fd)
+    try:
+        size = 0
+        async with aiofiles.open(path, "wb") as out:
+            async for chunk in request.stream():
+                size += len(chunk)
+                if size > MAX_BYTES:
+                    raise HTTPException(413, f"Fichier trop lourd (max {settings.IMPORT_MAX_MB} Mo)")
+                await out.write(chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+def _upsert(model, staged: list[str], author_id: int | None):
+    """INSERT … SELECT depuis la table temporaire ; (insérées, total) en une requête."""
+    staging = table(STAGING, *(column(name) for name in staged), column("line"))
+    names = [c.key for c in import_columns(model)]
+    values = [staging.c[name] for name in names]
+    if "published_at" in names:
+        # Même règle que les créations : un contenu publié sans date l'est à l'import
+        published = staging.c.status == literal_column("'published'")
+        values[names.index("published_at")] = case(
+            (published, func.coalesce(staging.c.published_at, func.now())), else_=staging.c.published_at,
+        )
+    src = staging
+    if _has_category(model):
+        categories = Category.__table__
+        src = staging.outerjoin(categories, categories.c.slug == staging.c.category_slug)
+        names.append("category_id")
+        values.append(categories.c.id)
+    updated = [name for name in names if name != "slug"]
+    if "author_id" in model.__table__.c:
+        names.append("author_id")
+        values.append(literal(author_id))
+
+    # Un slug répété dans le fichier : la dernière occurrence l'emporte
+    rows = select(*values).select_from(src).distinct(staging.c.slug).order_by(staging.c.slug, staging.c.line.desc())
+    stmt = insert(model.__table__).from_select(names, rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["slug"], set_={name: stmt.excluded[name] for name in updated},
+    ).returning(literal_column("xmax = 0").label("inserted"))
+    upserted = stmt.cte("upserted")
+    return select(func.count().filter(upserted.c.inserted), func.count()).select_from(upserted)
+
+
+def _unknown_categories(staged: list[str]):
+    staging = table(STAGING, *(column(name) for name in staged))
+    categories = Category.__table__
+    return (
+        select(staging.c.category_slug).distinct()
+        .select_from(staging.outerjoin(categories, categories.c.slug == staging.c.category_slug))
+        .where(staging.c.category_slug.is_not(None), categories.c.id.is_(None))
+        .order_by(staging.c.category_slug).limit(20)
+    )
+
+
+async def import_rows(db: AsyncSession, model, fmt: TransferFormat, path: str, author_id: int | None) -> dict:
+    """COPY du fichier dans la table temporaire puis upsert, dans la transaction de la requête."""
+    staged = [c.key for c in import_columns(model)] + (["category_slug"] if _has_category(model) else [])
+    await db.execute(text(
+        f"CREATE TEMP TABLE {STAGING} ON COMMIT DROP AS "
+        f"SELECT {', '.join(c.key for c in import_columns(model))}"
+        f"{', NULL::varchar AS category_slug' if _has_category(model) else ''}, 0::bigint AS line "
+        f"FROM {model.__tablename__} WITH NO DATA"
+    ))
+
+    with open(path, "rb") as file:
+        records = _records(model, (_ndjson if fmt == "ndjson" else _csv)(file))
+        count = 0
+
+        async def batches():
+            # Analyse hors boucle asyncio, par lots : mémoire bornée
+            nonlocal count
+            while batch := await asyncio.to_thread(lambda: list(islice(records, BATCH_ROWS))):
+                count += len(batch)
+                for record in batch:
+                    yield record
+
+        connection = await (await db.connection()).get_raw_connection()
+        try:
+            await connection.driver_connection.copy_records_to_table(
+                STAGING, records=batches(), columns=[*staged, "line"],
+            )
+        except (ValueError, asyncpg.PostgresError) as exc:
+            raise HTTPException(400, f"Import refusé : {exc}") from None
+
+    if _has_category(model):
+        if unknown := (await db.execute(_unknown_categories(staged))).scalars().all():
+            raise HTTPException(400, f"Catégories inconnues (à importer d'abord) : {', '.join(unknown)}")
+    try:
+        inserted, total = (await db.execute(_upsert(model, staged, author_id))).one()
+    except DBAPIError as exc:
+        # Message de Postgres (contrainte violée…), sans l'enveloppe du pilote
+        raise HTTPException(400, f"Import refusé : {exc.orig.__cause__ or exc.orig}") from None
+    return {"rows": count, "inserted": inserted, "updated": total - inserted}
@@ -0,0 +1,120 @@
+# core/variants.py
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+from core.config import settings
+from core.images import render_variant, run_in_pool
+
+# Format demandé (?fmt=) → format Pillow, et format d'origine → extension par défaut
+FORMATS = {"webp": "WEBP", "jpeg": "JPEG", "png": "PNG"}
+EXTENSIONS = {"JPEG": "jpeg", "WEBP": "webp", "PNG": "png"}
+
+# Inutile de réécrire l'atime à chaque hit : une heure suffit au tri LRU
+ATIME_RESOLUTION = 3600
+# Après une purge, redescendre sous ce ratio du budget pour ne pas purger à chaque variante
+EVICT_TARGET = 0.9
+
+cache_dir = Path(settings.IMAGE_CACHE_DIR)
+
+# Variantes en cours de calcul : les requêtes simultanées attendent la même tâche
+_inflight: dict[str, asyncio.Task] = {}
+_evict_lock = asyncio.Lock()
+
+
+@dataclass
+class VariantStats:
+    hits: int = 0
+    renders: int = 0
+    coalesced: int = 0       # requêtes servies par un calcul déjà en cours
+    evicted: int = 0
+    evicted_bytes: int = 0
+
+    def snapshot(self) -> dict:
+        return asdict(self)
+
+
+variant_stats = VariantStats()
+
+
+def variant_name(source: Path, width: int | None, height: int | None, fmt: str) -> str:
+    return f"{source.name}.{width or 0}x{height or 0}.{EXTENSIONS[fmt]}"
+
+
+def _touch(path: Path) -> bool:
+    """True si la variante existe ; rafraîchit son atime (noatime/relatime ne le font pas)."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return False
+    now = time.time()
+    if st.st_atime < now - ATIME_RESOLUTION:
+        os.utime(path, (now, st.st_mtime))
+    return True
+
+
+async def get_variant(source: Path, width: int | None, height: int | None, fmt: str) -> Path:
+    """Chemin de la variante, calculée dans le pool d'images si absente du cache."""
+    name = variant_name(source, width, height, fmt)
+    dest = cache_dir / name
+    if _touch(dest):
+        variant_stats.hits += 1
+        return dest
+
+    task = _inflight.get(name)
+    if task is None:
+        task = asyncio.ensure_future(_render(source, dest, width, height, fmt))
+        _inflight[name] = task
+        task.add_done_callback(lambda _: _inflight.pop(name, None))
+    else:
+        variant_stats.coalesced += 1
+    # shield : un client qui se déconnecte n'annule pas le calcul des autres
+    await asyncio.shield(task)
+    return dest
+
+
+async def _render(source: Path, dest: Path, width: int | None, height: int | None, fmt: str) -> None:
+    (cache_dir / ".tmp").mkdir(parents=True, exist_ok=True)
+    await run_in_pool(
+        render_variant, str(source), str(dest), width, height, fmt,
+        settings.IMAGE_WEBP_QUALITY if fmt == "WEBP" else settings.IMAGE_JPEG_QUALITY,
+    )
+    variant_stats.renders += 1
+    if not _evict_lock.locked():
+        asyncio.ensure_future(_evict())
+
+
+async def _evict() -> None:
+    async with _evict_lock:
+        count, size = await asyncio.to_thread(evict, settings.IMAGE_CACHE_MAX_MB * 1024 * 1024)
+        variant_stats.evicted += count
+        variant_stats.evicted_bytes += size
+
+
+def evict(budget: int) -> tuple[int, int]:
+    """Supprime les variantes les moins récemment servies au-delà du budget (bloquant)."""
+    entries = []
+    total = 0
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False):
+                st = entry.stat()
+                entries.append((st.st_atime, st.st_size, entry.path))
+                total += st.st_size
+    if total <= budget:
+        return 0, 0
+
+    count = freed = 0
+    for _, size, path in sorted(entries):
+        if total - freed <= budget * EVICT_TARGET:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            continue     # déjà purgée par un autre processus
+        count += 1
+        freed += size
+    return count, freed
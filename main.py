@@ -82,12 +82,18 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 from contextlib import asynccontextmanager
 
+from core.compression import CompressionMiddleware
+from core.categories import category_registry
 from core.config import settings
 from core.database import engine
+from core.images import shutdown_pool as shutdown_image_pool
+from core.metrics import MetricsMiddleware
+import core.querylog  # noqa — journal des requêtes lentes / N+1 selon les réglages
+from core.security import password_executor
+from core.static import UploadStaticFiles
 
 # Import de tous les modèles pour qu'Alembic les détecte
 import models.user        # noqa
@@ -96,14 +102,18 @@ import models.article     # noqa
 import models.publication # noqa
 import models.boutique    # noqa
 
-from routers import auth, categories, articles, publications, boutique, upload
+from routers import admin, auth, categories, articles, publications, boutique, media, metrics, upload
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Registre des catégories chargé avant la première requête
+    await category_registry.load()
     yield
     # Fermeture propre du pool async — sans greenlet
     await engine.dispose()
+    password_executor.shutdown(wait=False)
+    shutdown_image_pool()
 
 
 # Créer le dossier uploads AVANT l'instanciation de FastAPI
@@ -126,8 +136,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ── Compression gzip / Brotli ─────────────────────────────────────────────────
+app.add_middleware(CompressionMiddleware)
+
+# ── Métriques (ajouté en dernier = le plus externe : latence compression comprise) ──
+app.add_middleware(MetricsMiddleware)
+
 # ── Fichiers statiques ─────────────────────────────────────────────────────────
-app.mount("/uploads", StaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
+# /uploads/<fichier>?w=&h=&fmt= : variantes à la demande (route prioritaire sur le montage)
+app.include_router(media.router)
+app.mount("/uploads", UploadStaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
 
 # ── Routers ───────────────────────────────────────────────────────────────────
 app.include_router(auth.router)
@@ -136,6 +154,8 @@ app.include_router(articles.router)
 app.include_router(publications.router)
 app.include_router(boutique.router)
 app.include_router(upload.router)
+app.include_router(admin.router)
+app.include_router(metrics.router)
 
 
 @app.get("/", tags=["Health"])
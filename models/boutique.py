@@ -2,13 +2,23 @@
 
 from datetime import datetime, timezone
 from decimal import Decimal
-from sqlalchemy import String, Text, DateTime, ForeignKey, Numeric, Boolean, Enum as SAEnum
+from sqlalchemy import Computed, Index, text, String, Text, DateTime, ForeignKey, Numeric, Boolean, Enum as SAEnum
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from core.database import Base
+from core.search import ts_vector_sql
 
 
 class BoutiqueItem(Base):
     __tablename__ = "boutique_items"
+    __table_args__ = (
+        Index("ix_boutique_items_search_vector", "search_vector", postgresql_using="gin"),
+        # Pagination par curseur : (date, id) pour le public et le backoffice
+        Index("ix_boutique_items_published_keyset", "created_at", "id", postgresql_where=text("status = 'published'")),
+        Index("ix_boutique_items_created_keyset", "created_at", "id"),
+        # Recherche des suffixes libres (slug LIKE 'base-%') quelle que soit la collation
+        Index("ix_boutique_items_slug_pattern", "slug", postgresql_ops={"slug": "varchar_pattern_ops"}),
+    )
 
     id:          Mapped[int]          = mapped_column(primary_key=True, index=True)
     name:        Mapped[str]          = mapped_column(String(255), nullable=False)
@@ -35,6 +45,12 @@ class BoutiqueItem(Base):
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
+    # Recherche plein texte — colonne générée par Postgres, jamais chargée par défaut
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(ts_vector_sql(("name", "A"), ("description", "B"), ("content", "C")), persisted=True),
+        deferred=True,
+    )
 
-    category = relationship("Category", lazy="joined")
-    author   = relationship("User", lazy="joined")
\ No newline at end of file
+    category = relationship("Category", lazy="raise_on_sql")
+    author   = relationship("User", lazy="raise_on_sql")
\ No newline at end of file
@@ -1,13 +1,29 @@
 # models/publication.py
 
 from datetime import datetime, timezone
-from sqlalchemy import String, Text, DateTime, ForeignKey, Enum as SAEnum
+from sqlalchemy import CheckConstraint, Computed, Index, text, String, Text, DateTime, ForeignKey, Enum as SAEnum
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from core.database import Base
+from core.search import ts_vector_sql
 
 
 class Publication(Base):
     __tablename__ = "publications"
+    __table_args__ = (
+        Index("ix_publications_search_vector", "search_vector", postgresql_using="gin"),
+        # Pagination par curseur : (date, id) pour le public et le backoffice
+        # (date publique : clé de tri de core.pagination.sort_date)
+        Index(
+            "ix_publications_published_keyset", text("coalesce(published_at, '-infinity'::timestamptz)"), "id",
+            postgresql_where=text("status = 'published'"),
+        ),
+        Index("ix_publications_created_keyset", "created_at", "id"),
+        # Recherche des suffixes libres (slug LIKE 'base-%') quelle que soit la collation
+        Index("ix_publications_slug_pattern", "slug", postgresql_ops={"slug": "varchar_pattern_ops"}),
+        # Publié ⇒ daté : la liste publique et son curseur reposent dessus
+        CheckConstraint("status <> 'published' OR published_at IS NOT NULL", name="ck_publications_published_at"),
+    )
 
     id:           Mapped[int]             = mapped_column(primary_key=True, index=True)
     title:        Mapped[str]             = mapped_column(String(255), nullable=False)
@@ -32,6 +48,12 @@ class Publication(Base):
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
+    # Recherche plein texte — colonne générée par Postgres, jamais chargée par défaut
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(ts_vector_sql(("title", "A"), ("excerpt", "B"), ("content", "C")), persisted=True),
+        deferred=True,
+    )
 
-    category = relationship("Category", lazy="joined")
-    author   = relationship("User", lazy="joined")
\ No newline at end of file
+    category = relationship("Category", lazy="raise_on_sql")
+    author   = relationship("User", lazy="raise_on_sql")
\ No newline at end of file
@@ -1,7 +1,7 @@
 # models/user.py
 
 from datetime import datetime, timezone
-from sqlalchemy import String, Boolean, DateTime
+from sqlalchemy import String, Boolean, DateTime, Integer
 from sqlalchemy.orm import Mapped, mapped_column
 from core.database import Base
 
@@ -15,6 +15,8 @@ class User(Base):
     password:   Mapped[str]      = mapped_column(String(255), nullable=False)
     is_active:  Mapped[bool]     = mapped_column(Boolean, default=True)
     is_admin:   Mapped[bool]     = mapped_column(Boolean, default=True)
+    # Incrémenté pour révoquer tous les jetons émis (cf. core.deps.revoke_tokens)
+    token_version: Mapped[int]   = mapped_column(Integer, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc)
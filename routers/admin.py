@@ -0,0 +1,64 @@
+# routers/admin.py
+
+import os
+from datetime import date
+
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
+
+from core.cache import invalidate
+from core.categories import category_registry
+from core.deps import CurrentUser, DBDep
+from core.metrics import process_stats
+from core.transfer import MEDIA_TYPES, MODELS, NAMESPACES, TransferFormat, TransferKind, export_rows, import_rows, spool
+from schemas.transfer import ImportOut
+
+router = APIRouter(prefix="/api/admin", tags=["Admin"])
+
+
+@router.get("/stats")
+async def stats(_: CurrentUser):
+    """Compteurs internes du processus courant (chaque worker Passenger a les siens)."""
+    return process_stats()
+
+
+# ── Export / import en masse (sauvegardes, migrations entre bases) ────────────
+
+@router.get("/export/{kind}")
+async def export_content(
+    kind: TransferKind,
+    _: CurrentUser,
+    fmt: TransferFormat = Query("ndjson", alias="format", description="ndjson | csv"),
+):
+    """Table entière, instantané cohérent, diffusée au fil d'un curseur serveur (cf. core.transfer)."""
+    return StreamingResponse(
+        export_rows(MODELS[kind], fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{kind}-{date.today()}.{fmt}"'},
+    )
+
+
+@router.post("/import/{kind}", response_model=ImportOut)
+async def import_content(
+    kind: TransferKind,
+    request: Request,
+    db: DBDep,
+    current_user: CurrentUser,
+    fmt: TransferFormat = Query("ndjson", alias="format", description="ndjson | csv"),
+):
+    """
+    Corps brut au format d'un export (NDJSON ou CSV avec en-tête) ; upsert par slug.
+    Les catégories référencées (category_slug) doivent exister : importer les catégories d'abord.
+    """
+    path = await spool(request)
+    try:
+        result = await import_rows(db, MODELS[kind], fmt, path, current_user.id)
+    finally:
+        os.unlink(path)
+    if kind == "categories":
+        # Les contenus embarquent leur catégorie (nom, slug) dans les réponses en cache
+        invalidate(db, *NAMESPACES.values())
+        category_registry.refresh(db)
+    else:
+        invalidate(db, NAMESPACES[kind])
+    return result
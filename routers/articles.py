@@ -1,14 +1,25 @@
 # routers/articles.py
 
 from datetime import datetime, timezone
-from fastapi import APIRouter, HTTPException, Query
-from sqlalchemy import select, func
+from fastapi import APIRouter, HTTPException, Query, Request
 from slugify import slugify
 
-from core.deps import DBDep, CurrentUser
+from core.bulk import bulk_create, bulk_delete, bulk_set_status, bulk_update
+from core.cache import invalidate
+from core.categories import category_registry
+from core.counters import list_stats
+from core.deps import DBDep, CurrentUser, ReadDBDep
+from core.http_cache import (
+    cache_response, cached_response, is_conditional, list_validators, not_modified, row_validators,
+)
+from core.pagination import cursor_params, next_cursor, total_pages
+from core.render import ListView, list_projection, render, render_response
+from core.search import SortOrder
+from core.slugs import add_with_slug
+from core.statements import admin_filters, by_id, by_slug, list_page, public_filters, version_by_slug
 from models.article import Article
-from models.category import Category
-from schemas.article import ArticleCreate, ArticleUpdate, ArticleOut, ArticleListOut
+from schemas.bulk import BulkIds, BulkItems, BulkOut, BulkStatusIn
+from schemas.article import ArticleCreate, ArticleUpdate, ArticleUpdateItem, ArticleOut, ArticleListOut, ArticleSummaryListOut
 
 router = APIRouter(prefix="/api/articles", tags=["Articles"])
 
@@ -25,58 +36,60 @@ async def list_articles_admin(
     per_page: int = Query(20, ge=1, le=PER_PAGE_MAX),
     status: str | None = None,
     search: str | None = None,
+    cursor: str | None = Query(None, description="Curseur opaque (next_cursor) — remplace page"),
+    include_total: bool = Query(True, description="false : ne pas compter (défilement infini)"),
 ):
-    q = select(Article)
-    if status:
-        q = q.where(Article.status == status)
-    if search:
-        q = q.where(Article.title.ilike(f"%{search}%"))
-
-    total = (await db.execute(select(func.count()).select_from(q.subquery()))).scalar_one()
-    items = (await db.execute(
-        q.order_by(Article.created_at.desc())
-        .offset((page - 1) * per_page)
-        .limit(per_page)
+    filters = admin_filters(Article, "title", bool(status), bool(search))
+    params = {"status": status, "pattern": f"%{search}%"}
+
+    total = None
+    if include_total:
+        cache_key = None if search else ("article", status, None)
+        total = (await list_stats(db, Article, filters, params, cache_key)).total
+
+    params |= cursor_params(cursor) if cursor else {"offset": (page - 1) * per_page}
+    rows = (await db.execute(
+        list_page(Article, "created_at", filters, cursor=bool(cursor)), params | {"limit": per_page + 1},
     )).scalars().all()
 
-    return ArticleListOut(
-        items=items, total=total,
-        total_pages=max(1, -(-total // per_page)),
+    await category_registry.attach(rows[:per_page])
+    return render_response(
+        ArticleListOut,
+        items=rows[:per_page], total=total,
+        total_pages=total_pages(total, per_page),
         page=page, per_page=per_page,
+        has_more=len(rows) > per_page,
+        next_cursor=next_cursor(rows, per_page, "created_at"),
     )
 
 
 @router.get("/admin/{article_id}", response_model=ArticleOut)
 async def get_article_admin(article_id: int, db: DBDep, _: CurrentUser):
-    result = await db.execute(select(Article).where(Article.id == article_id))
+    result = await db.execute(by_id(Article), {"id": article_id})
     article = result.scalar_one_or_none()
     if not article:
         raise HTTPException(404, "Article introuvable")
-    return article
+    await category_registry.attach([article])
+    return render_response(ArticleOut, article)
 
 
 @router.post("", response_model=ArticleOut, status_code=201)
 async def create_article(payload: ArticleCreate, db: DBDep, current_user: CurrentUser):
-    slug = payload.slug or slugify(payload.title)
-    base_slug, counter = slug, 1
-    while (await db.execute(select(Article).where(Article.slug == slug))).scalar_one_or_none():
-        slug = f"{base_slug}-{counter}"
-        counter += 1
-
     article = Article(
         **payload.model_dump(exclude={"slug"}),
-        slug=slug,
         published_at=datetime.now(timezone.utc) if payload.status == "published" else None,
         author_id=current_user.id,
     )
-    db.add(article)
-    await db.flush()
+    await add_with_slug(db, article, payload.slug or slugify(payload.title))
+    await db.refresh(article, ["author"])
+    await category_registry.attach([article])
+    invalidate(db, "article")
     return article
 
 
 @router.put("/{article_id}", response_model=ArticleOut)
 async def update_article(article_id: int, payload: ArticleUpdate, db: DBDep, _: CurrentUser):
-    result = await db.execute(select(Article).where(Article.id == article_id))
+    result = await db.execute(by_id(Article), {"id": article_id})
     article = result.scalar_one_or_none()
     if not article:
         raise HTTPException(404, "Article introuvable")
@@ -90,54 +103,126 @@ async def update_article(article_id: int, payload: ArticleUpdate, db: DBDep, _:
     for key, value in data.items():
         setattr(article, key, value)
     await db.flush()
+    await category_registry.attach([article])
+    invalidate(db, "article")
     return article
 
 
 @router.delete("/{article_id}", status_code=204)
 async def delete_article(article_id: int, db: DBDep, _: CurrentUser):
-    result = await db.execute(select(Article).where(Article.id == article_id))
+    result = await db.execute(by_id(Article, with_related=False), {"id": article_id})
     article = result.scalar_one_or_none()
     if not article:
         raise HTTPException(404, "Article introuvable")
     await db.delete(article)
+    invalidate(db, "article")
+
+
+# ── Écritures groupées (backoffice, imports) : un lot = une transaction ───────
+
+@router.post("/bulk", response_model=BulkOut)
+async def create_articles_bulk(payload: BulkItems[ArticleCreate], db: DBDep, current_user: CurrentUser):
+    now = datetime.now(timezone.utc)
+    rows = [
+        item.model_dump(exclude={"slug"})
+        | {"published_at": now if item.status == "published" else None, "author_id": current_user.id}
+        for item in payload.items
+    ]
+    bases = [item.slug or slugify(item.title) for item in payload.items]
+    result = await bulk_create(db, Article, rows, bases)
+    invalidate(db, "article")
+    return result
+
+
+@router.patch("/bulk", response_model=BulkOut)
+async def update_articles_bulk(payload: BulkItems[ArticleUpdateItem], db: DBDep, _: CurrentUser):
+    result = await bulk_update(db, Article, [item.model_dump(exclude_unset=True) for item in payload.items])
+    invalidate(db, "article")
+    return result
+
+
+@router.post("/bulk/status", response_model=BulkOut)
+async def set_articles_status_bulk(payload: BulkStatusIn, db: DBDep, _: CurrentUser):
+    result = await bulk_set_status(db, Article, payload.ids, payload.status)
+    invalidate(db, "article")
+    return result
+
+
+@router.post("/bulk/delete", response_model=BulkOut)
+async def delete_articles_bulk(payload: BulkIds, db: DBDep, _: CurrentUser):
+    result = await bulk_delete(db, Article, payload.ids)
+    invalidate(db, "article")
+    return result
 
 
 # ── Public — /{slug} en DERNIER pour ne pas capturer /admin/... ───────────────
 
-@router.get("", response_model=ArticleListOut)
+@router.get("", response_model=ArticleListOut | ArticleSummaryListOut)
 async def list_articles(
-    db: DBDep,
+    request: Request,
+    db: ReadDBDep,
     page: int = Query(1, ge=1),
     per_page: int = Query(9, ge=1, le=PER_PAGE_MAX),
     category: str | None = None,
     search: str | None = None,
+    sort: SortOrder | None = Query(None, description="relevance | date (défaut : relevance si search)"),
+    cursor: str | None = Query(None, description="Curseur opaque (next_cursor) — remplace page"),
+    include_total: bool = Query(True, description="false : ne pas compter (défilement infini)"),
+    view: ListView = Query("full", description="summary : items sans content (cartes)"),
+    fields: str | None = Query(None, description="Champs des items, séparés par des virgules (ex. id,title,slug,image_url)"),
 ):
-    q = select(Article).where(Article.status == "published")
-    if category:
-        q = q.join(Category, Article.category_id == Category.id).where(Category.slug == category)
-    if search:
-        q = q.where(Article.title.ilike(f"%{search}%") | Article.content.ilike(f"%{search}%"))
-
-    total = (await db.execute(select(func.count()).select_from(q.subquery()))).scalar_one()
-    items = (await db.execute(
-        q.order_by(Article.published_at.desc())
-        .offset((page - 1) * per_page)
-        .limit(per_page)
+    if cached := cached_response("article", request):
+        return cached
+
+    await category_registry.ensure()
+    page_out, load = list_projection(ArticleListOut, ArticleSummaryListOut, view, fields)
+    filters = public_filters(Article, bool(category), bool(search))
+    params = {"category_id": await category_registry.id_for(category), "search": search}
+
+    total = validators = None
+    if include_total:
+        # Totaux + empreinte HTTP : un 304 ne charge ni ne sérialise aucune ligne
+        cache_key = None if search else ("article", "published", category)
+        stats = await list_stats(db, Article, filters, params, cache_key)
+        validators = list_validators(request, stats)
+        if response := not_modified(request, validators):
+            return response
+        total = stats.total
+
+    by_rank = bool(search) and sort != "date" and not cursor
+    params |= cursor_params(cursor) if cursor else {"offset": (page - 1) * per_page}
+    rows = (await db.execute(
+        list_page(Article, "published_at", filters, by_rank, bool(cursor), load), params | {"limit": per_page + 1},
     )).scalars().all()
 
-    return ArticleListOut(
-        items=items, total=total,
-        total_pages=max(1, -(-total // per_page)),
+    await category_registry.attach(rows[:per_page], load)
+    return cache_response("article", request, render(
+        page_out,
+        items=rows[:per_page], total=total,
+        total_pages=total_pages(total, per_page),
         page=page, per_page=per_page,
-    )
+        has_more=len(rows) > per_page,
+        # Le tri par pertinence ne se pagine que par page
+        next_cursor=None if by_rank else next_cursor(rows, per_page, "published_at"),
+    ), validators)
 
 
 @router.get("/{slug}", response_model=ArticleOut)
-async def get_article(slug: str, db: DBDep):
-    result = await db.execute(
-        select(Article).where(Article.slug == slug, Article.status == "published")
-    )
+async def get_article(slug: str, request: Request, db: ReadDBDep):
+    if cached := cached_response("article", request):
+        return cached
+    await category_registry.ensure()
+    if is_conditional(request):
+        # Revalidation sans charger le contenu : id + updated_at suffisent
+        row = (await db.execute(version_by_slug(Article), {"slug": slug})).one_or_none()
+        if row and (response := not_modified(request, row_validators(*row))):
+            return response
+
+    result = await db.execute(by_slug(Article), {"slug": slug})
     article = result.scalar_one_or_none()
     if not article:
         raise HTTPException(404, "Article introuvable")
-    return article
\ No newline at end of file
+    await category_registry.attach([article])
+    return cache_response(
+        "article", request, render(ArticleOut, article), row_validators(article.id, article.updated_at),
+    )
@@ -6,11 +6,11 @@ from sqlalchemy import select
 from typing import Annotated
 
 from core.database import get_db
-from core.security import verify_password, create_access_token
-from core.deps import DBDep, CurrentUser
+from core.security import verify_password_async, create_access_token
+from core.deps import DBDep, CurrentUser, revoke_tokens
 from models.user import User
-from schemas.user import TokenOut, UserOut, UserCreate
-from core.security import hash_password
+from schemas.user import PasswordChange, TokenOut, UserOut, UserCreate
+from core.security import hash_password_async
 
 router = APIRouter(prefix="/api/auth", tags=["Auth"])
 
@@ -23,7 +23,7 @@ async def login(
     result = await db.execute(select(User).where(User.email == form.username))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(form.password, user.password):
+    if not user or not await verify_password_async(form.password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Email ou mot de passe incorrect",
@@ -31,7 +31,7 @@ async def login(
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Compte désactivé")
 
-    token = create_access_token({"sub": str(user.id)})
+    token = create_access_token({"sub": str(user.id), "ver": user.token_version})
     return TokenOut(access_token=token, user=UserOut.model_validate(user))
 
 
@@ -40,6 +40,43 @@ async def me(current_user: CurrentUser):
     return current_user
 
 
+@router.put("/password", response_model=TokenOut)
+async def change_password(payload: PasswordChange, db: DBDep, current_user: CurrentUser):
+    """Nouveau mot de passe : tous les jetons émis sont révoqués, un nouveau est renvoyé."""
+    # Le principal peut venir du cache : compte supprimé, désactivé ou jetons révoqués
+    # depuis un autre processus → 401, avant de toucher à token_version
+    user = await db.get(User, current_user.id)
+    if user is None or not user.is_active or user.token_version != current_user.token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token invalide ou expiré",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if not await verify_password_async(payload.current_password, user.password):
+        raise HTTPException(status_code=400, detail="Mot de passe actuel incorrect")
+    user.password = await hash_password_async(payload.new_password)
+    revoke_tokens(db, user)
+    await db.flush()
+    token = create_access_token({"sub": str(user.id), "ver": user.token_version})
+    return TokenOut(access_token=token, user=UserOut.model_validate(user))
+
+
+@router.post("/users/{user_id}/deactivate", response_model=UserOut)
+async def deactivate_user(user_id: int, db: DBDep, current_user: CurrentUser):
+    """Désactive un compte et révoque ses jetons (effectif dans ce processus dès le commit)."""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Réservé aux administrateurs")
+    if user_id == current_user.id:
+        raise HTTPException(status_code=400, detail="Impossible de désactiver son propre compte")
+    user = await db.get(User, user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="Utilisateur introuvable")
+    user.is_active = False
+    revoke_tokens(db, user)
+    await db.flush()
+    return user
+
+
 # ── Route d'initialisation (à supprimer après le 1er déploiement) ──
 @router.post("/init", response_model=UserOut, include_in_schema=False)
 async def init_admin(payload: UserCreate, db: DBDep):
@@ -54,7 +91,7 @@ async def init_admin(payload: UserCreate, db: DBDep):
     user = User(
         email=payload.email,
         username=payload.username,
-        password=hash_password(payload.password),
+        password=await hash_password_async(payload.password),
         is_admin=True,
     )
     db.add(user)
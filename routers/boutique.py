@@ -1,13 +1,24 @@
 # routers/boutique.py
 
-from fastapi import APIRouter, HTTPException, Query
-from sqlalchemy import select, func
+from fastapi import APIRouter, HTTPException, Query, Request
 from slugify import slugify
 
-from core.deps import DBDep, CurrentUser
+from core.bulk import bulk_create, bulk_delete, bulk_set_status, bulk_update
+from core.cache import invalidate
+from core.categories import category_registry
+from core.counters import list_stats
+from core.deps import DBDep, CurrentUser, ReadDBDep
+from core.http_cache import (
+    cache_response, cached_response, is_conditional, list_validators, not_modified, row_validators,
+)
+from core.pagination import cursor_params, next_cursor, total_pages
+from core.render import ListView, list_projection, render, render_response
+from core.search import SortOrder
+from core.slugs import add_with_slug
+from core.statements import admin_filters, by_id, by_slug, list_page, public_filters, version_by_slug
 from models.boutique import BoutiqueItem
-from models.category import Category
-from schemas.boutique import BoutiqueItemCreate, BoutiqueItemUpdate, BoutiqueItemOut, BoutiqueListOut
+from schemas.bulk import BulkIds, BulkItems, BulkOut, BulkStatusIn
+from schemas.boutique import BoutiqueItemCreate, BoutiqueItemUpdate, BoutiqueItemUpdateItem, BoutiqueItemOut, BoutiqueListOut, BoutiqueSummaryListOut
 
 router = APIRouter(prefix="/api/boutique", tags=["Boutique"])
 
@@ -23,110 +34,182 @@ async def list_items_admin(
     per_page: int = Query(20, ge=1, le=PER_PAGE_MAX),
     status: str | None = None,
     search: str | None = None,
+    cursor: str | None = Query(None, description="Curseur opaque (next_cursor) — remplace page"),
+    include_total: bool = Query(True, description="false : ne pas compter (défilement infini)"),
 ):
-    q = select(BoutiqueItem)
-    if status: q = q.where(BoutiqueItem.status == status)
-    if search: q = q.where(BoutiqueItem.name.ilike(f"%{search}%"))
-
-    total = (await db.execute(select(func.count()).select_from(q.subquery()))).scalar_one()
-    items = (await db.execute(
-        q.order_by(BoutiqueItem.created_at.desc())
-        .offset((page - 1) * per_page)
-        .limit(per_page)
+    filters = admin_filters(BoutiqueItem, "name", bool(status), bool(search))
+    params = {"status": status, "pattern": f"%{search}%"}
+
+    total = None
+    if include_total:
+        cache_key = None if search else ("boutique", status, None)
+        total = (await list_stats(db, BoutiqueItem, filters, params, cache_key)).total
+
+    params |= cursor_params(cursor) if cursor else {"offset": (page - 1) * per_page}
+    rows = (await db.execute(
+        list_page(BoutiqueItem, "created_at", filters, cursor=bool(cursor)), params | {"limit": per_page + 1},
     )).scalars().all()
 
-    return BoutiqueListOut(
-        items=items, total=total,
-        total_pages=max(1, -(-total // per_page)),
+    await category_registry.attach(rows[:per_page])
+    return render_response(
+        BoutiqueListOut,
+        items=rows[:per_page], total=total,
+        total_pages=total_pages(total, per_page),
         page=page, per_page=per_page,
+        has_more=len(rows) > per_page,
+        next_cursor=next_cursor(rows, per_page, "created_at"),
     )
 
 
 @router.get("/admin/{item_id}", response_model=BoutiqueItemOut)
 async def get_item_admin(item_id: int, db: DBDep, _: CurrentUser):
-    result = await db.execute(select(BoutiqueItem).where(BoutiqueItem.id == item_id))
+    result = await db.execute(by_id(BoutiqueItem), {"id": item_id})
     item = result.scalar_one_or_none()
     if not item:
         raise HTTPException(404, "Produit introuvable")
-    return item
+    await category_registry.attach([item])
+    return render_response(BoutiqueItemOut, item)
 
 
 @router.post("", response_model=BoutiqueItemOut, status_code=201)
 async def create_item(payload: BoutiqueItemCreate, db: DBDep, current_user: CurrentUser):
-    slug = payload.slug or slugify(payload.name)
-    base_slug, counter = slug, 1
-    while (await db.execute(select(BoutiqueItem).where(BoutiqueItem.slug == slug))).scalar_one_or_none():
-        slug = f"{base_slug}-{counter}"
-        counter += 1
-
     item = BoutiqueItem(
         **payload.model_dump(exclude={"slug"}),
-        slug=slug,
         author_id=current_user.id,
     )
-    db.add(item)
-    await db.flush()
+    await add_with_slug(db, item, payload.slug or slugify(payload.name))
+    await db.refresh(item, ["author"])
+    await category_registry.attach([item])
+    invalidate(db, "boutique")
     return item
 
 
 @router.put("/{item_id}", response_model=BoutiqueItemOut)
 async def update_item(item_id: int, payload: BoutiqueItemUpdate, db: DBDep, _: CurrentUser):
-    result = await db.execute(select(BoutiqueItem).where(BoutiqueItem.id == item_id))
+    result = await db.execute(by_id(BoutiqueItem), {"id": item_id})
     item = result.scalar_one_or_none()
     if not item:
         raise HTTPException(404, "Produit introuvable")
 
-    for key, value in payload.model_dump(exclude_unset=True).items():
+    data = payload.model_dump(exclude_unset=True)
+    for key, value in data.items():
         setattr(item, key, value)
     await db.flush()
+    await category_registry.attach([item])
+    invalidate(db, "boutique")
     return item
 
 
 @router.delete("/{item_id}", status_code=204)
 async def delete_item(item_id: int, db: DBDep, _: CurrentUser):
-    result = await db.execute(select(BoutiqueItem).where(BoutiqueItem.id == item_id))
+    result = await db.execute(by_id(BoutiqueItem, with_related=False), {"id": item_id})
     item = result.scalar_one_or_none()
     if not item:
         raise HTTPException(404, "Produit introuvable")
     await db.delete(item)
+    invalidate(db, "boutique")
+
+
+# ── Écritures groupées (backoffice, imports) : un lot = une transaction ───────
+
+@router.post("/bulk", response_model=BulkOut)
+async def create_items_bulk(payload: BulkItems[BoutiqueItemCreate], db: DBDep, current_user: CurrentUser):
+    rows = [item.model_dump(exclude={"slug"}) | {"author_id": current_user.id} for item in payload.items]
+    bases = [item.slug or slugify(item.name) for item in payload.items]
+    result = await bulk_create(db, BoutiqueItem, rows, bases)
+    invalidate(db, "boutique")
+    return result
+
+
+@router.patch("/bulk", response_model=BulkOut)
+async def update_items_bulk(payload: BulkItems[BoutiqueItemUpdateItem], db: DBDep, _: CurrentUser):
+    result = await bulk_update(db, BoutiqueItem, [item.model_dump(exclude_unset=True) for item in payload.items])
+    invalidate(db, "boutique")
+    return result
+
+
+@router.post("/bulk/status", response_model=BulkOut)
+async def set_items_status_bulk(payload: BulkStatusIn, db: DBDep, _: CurrentUser):
+    result = await bulk_set_status(db, BoutiqueItem, payload.ids, payload.status)
+    invalidate(db, "boutique")
+    return result
+
+
+@router.post("/bulk/delete", response_model=BulkOut)
+async def delete_items_bulk(payload: BulkIds, db: DBDep, _: CurrentUser):
+    result = await bulk_delete(db, BoutiqueItem, payload.ids)
+    invalidate(db, "boutique")
+    return result
 
 
 # ── Public — en DERNIER ───────────────────────────────────────────────────────
 
-@router.get("", response_model=BoutiqueListOut)
+@router.get("", response_model=BoutiqueListOut | BoutiqueSummaryListOut)
 async def list_items(
-    db: DBDep,
+    request: Request,
+    db: ReadDBDep,
     page: int = Query(1, ge=1),
     per_page: int = Query(12, ge=1, le=PER_PAGE_MAX),
     category: str | None = None,
     search: str | None = None,
+    sort: SortOrder | None = Query(None, description="relevance | date (défaut : relevance si search)"),
+    cursor: str | None = Query(None, description="Curseur opaque (next_cursor) — remplace page"),
+    include_total: bool = Query(True, description="false : ne pas compter (défilement infini)"),
+    view: ListView = Query("full", description="summary : items sans content (cartes)"),
+    fields: str | None = Query(None, description="Champs des items, séparés par des virgules (ex. id,title,slug,image_url)"),
 ):
-    q = select(BoutiqueItem).where(BoutiqueItem.status == "published")
-    if category:
-        q = q.join(Category, BoutiqueItem.category_id == Category.id).where(Category.slug == category)
-    if search:
-        q = q.where(BoutiqueItem.name.ilike(f"%{search}%") | BoutiqueItem.description.ilike(f"%{search}%"))
-
-    total = (await db.execute(select(func.count()).select_from(q.subquery()))).scalar_one()
-    items = (await db.execute(
-        q.order_by(BoutiqueItem.created_at.desc())
-        .offset((page - 1) * per_page)
-        .limit(per_page)
+    if cached := cached_response("boutique", request):
+        return cached
+
+    await category_registry.ensure()
+    page_out, load = list_projection(BoutiqueListOut, BoutiqueSummaryListOut, view, fields)
+    filters = public_filters(BoutiqueItem, bool(category), bool(search))
+    params = {"category_id": await category_registry.id_for(category), "search": search}
+
+    total = validators = None
+    if include_total:
+        # Totaux + empreinte HTTP : un 304 ne charge ni ne sérialise aucune ligne
+        cache_key = None if search else ("boutique", "published", category)
+        stats = await list_stats(db, BoutiqueItem, filters, params, cache_key)
+        validators = list_validators(request, stats)
+        if response := not_modified(request, validators):
+            return response
+        total = stats.total
+
+    by_rank = bool(search) and sort != "date" and not cursor
+    params |= cursor_params(cursor) if cursor else {"offset": (page - 1) * per_page}
+    rows = (await db.execute(
+        list_page(BoutiqueItem, "created_at", filters, by_rank, bool(cursor), load), params | {"limit": per_page + 1},
     )).scalars().all()
 
-    return BoutiqueListOut(
-        items=items, total=total,
-        total_pages=max(1, -(-total // per_page)),
+    await category_registry.attach(rows[:per_page], load)
+    return cache_response("boutique", request, render(
+        page_out,
+        items=rows[:per_page], total=total,
+        total_pages=total_pages(total, per_page),
         page=page, per_page=per_page,
-    )
+        has_more=len(rows) > per_page,
+        # Le tri par pertinence ne se pagine que par page
+        next_cursor=None if by_rank else next_cursor(rows, per_page, "created_at"),
+    ), validators)
 
 
 @router.get("/{slug}", response_model=BoutiqueItemOut)
-async def get_item(slug: str, db: DBDep):
-    result = await db.execute(
-        select(BoutiqueItem).where(BoutiqueItem.slug == slug, BoutiqueItem.status == "published")
-    )
+async def get_item(slug: str, request: Request, db: ReadDBDep):
+    if cached := cached_response("boutique", request):
+        return cached
+    await category_registry.ensure()
+    if is_conditional(request):
+        # Revalidation sans charger le contenu : id + updated_at suffisent
+        row = (await db.execute(version_by_slug(BoutiqueItem), {"slug": slug})).one_or_none()
+        if row and (response := not_modified(request, row_validators(*row))):
+            return response
+
+    result = await db.execute(by_slug(BoutiqueItem), {"slug": slug})
     item = result.scalar_one_or_none()
     if not item:
         raise HTTPException(404, "Produit introuvable")
-    return item
\ No newline at end of file
+    await category_registry.attach([item])
+    return cache_response(
+        "boutique", request, render(BoutiqueItemOut, item), row_validators(item.id, item.updated_at),
+    )
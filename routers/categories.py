@@ -1,12 +1,16 @@
 # routers/categories.py
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 from sqlalchemy import select
 from slugify import slugify
 
+from core.cache import invalidate
+from core.categories import category_registry
 from core.deps import DBDep, CurrentUser
+from core.http_cache import cache_response, cached_response
+from core.render import render
 from models.category import Category
-from schemas.category import CategoryCreate, CategoryUpdate, CategoryOut
+from schemas.category import CategoryCreate, CategoryUpdate, CategoryOut, CategoryListOut
 
 router = APIRouter(prefix="/api/categories", tags=["Catégories"])
 
@@ -15,14 +19,14 @@ router = APIRouter(prefix="/api/categories", tags=["Catégories"])
 
 @router.get("", response_model=list[CategoryOut])
 async def list_categories(
-    db: DBDep,
+    request: Request,
     type: str | None = Query(None, description="article | publication | boutique"),
 ):
-    q = select(Category)
-    if type:
-        q = q.where(Category.content_type == type)
-    result = await db.execute(q.order_by(Category.name))
-    return result.scalars().all()
+    if cached := cached_response("category", request):
+        return cached
+
+    await category_registry.ensure()
+    return cache_response("category", request, render(CategoryListOut, category_registry.listing(type)))
 
 
 # ── Protégés (backoffice) ────────────────────────────────────────────────────
@@ -37,6 +41,8 @@ async def create_category(payload: CategoryCreate, db: DBDep, _: CurrentUser):
     cat = Category(name=payload.name, slug=slug, content_type=payload.content_type)
     db.add(cat)
     await db.flush()
+    invalidate(db, "category")
+    category_registry.refresh(db)
     return cat
 
 
@@ -52,6 +58,8 @@ async def update_category(cat_id: int, payload: CategoryUpdate, db: DBDep, _: Cu
     if payload.slug is not None:
         cat.slug = payload.slug
     await db.flush()
+    invalidate(db, "category", cat.content_type)   # les contenus embarquent leur catégorie
+    category_registry.refresh(db)
     return cat
 
 
@@ -61,4 +69,6 @@ async def delete_category(cat_id: int, db: DBDep, _: CurrentUser):
     cat = result.scalar_one_or_none()
     if not cat:
         raise HTTPException(404, "Catégorie introuvable")
-    await db.delete(cat)
\ No newline at end of file
+    await db.delete(cat)
+    invalidate(db, "category", cat.content_type)
+    category_registry.refresh(db)
\ No newline at end of file
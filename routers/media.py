@@ -0,0 +1,55 @@
+# routers/media.py
+
+import stat
+from pathlib import Path
+from typing import Literal
+from fastapi import APIRouter, HTTPException, Query, Request
+from PIL import Image, UnidentifiedImageError
+
+from core.config import settings
+from core.static import serve_file
+from core.variants import FORMATS, get_variant
+
+# Déclaré AVANT le montage StaticFiles /uploads : les fichiers à la racine passent ici,
+# servis tels quels sans paramètre, redimensionnés sinon.
+router = APIRouter(prefix="/uploads", tags=["Media"])
+
+SOURCE_FORMATS = {".jpg": "JPEG", ".jpeg": "JPEG", ".png": "PNG", ".webp": "WEBP", ".gif": "PNG"}
+
+
+@router.get("/{filename}")
+async def get_upload(
+    filename: str,
+    request: Request,
+    w: int | None = Query(None, description="Largeur max (tailles autorisées : IMAGE_RESIZE_SIZES)"),
+    h: int | None = Query(None, description="Hauteur max"),
+    fmt: Literal["webp", "jpeg", "png"] | None = Query(None, description="Format de sortie"),
+):
+    if filename.startswith("."):
+        raise HTTPException(404, "Fichier introuvable")
+    source = Path(settings.UPLOAD_DIR) / filename
+    try:
+        stat_result = source.stat()
+    except OSError:
+        stat_result = None
+    if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+        raise HTTPException(404, "Fichier introuvable")
+
+    if w is None and h is None and fmt is None:
+        return serve_file(request.scope, source, stat_result, settings.UPLOAD_ACCEL_PREFIX + filename)
+
+    allowed = settings.image_resize_sizes_set
+    if (w is not None and w not in allowed) or (h is not None and h not in allowed):
+        raise HTTPException(400, f"Taille non autorisée. Acceptées : {sorted(allowed)}")
+    target = FORMATS[fmt] if fmt else SOURCE_FORMATS.get(source.suffix.lower())
+    if target is None:
+        raise HTTPException(400, "Ce fichier ne peut pas être redimensionné")
+
+    try:
+        variant = await get_variant(source, w, h, target)
+    except Image.DecompressionBombError:
+        # Pas une sous-classe d'OSError
+        raise HTTPException(400, "Image trop grande pour être redimensionnée")
+    except (UnidentifiedImageError, OSError):
+        raise HTTPException(400, "Image impossible à traiter")
+    return serve_file(request.scope, variant, accel_uri=settings.IMAGE_CACHE_ACCEL_PREFIX + variant.name)
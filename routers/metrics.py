@@ -0,0 +1,20 @@
+# routers/metrics.py
+
+from hmac import compare_digest
+
+from fastapi import APIRouter, Header, HTTPException, Response
+
+from core.config import settings
+from core.metrics import render
+
+router = APIRouter(tags=["Monitoring"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(authorization: str = Header("")):
+    """Métriques Prometheus du processus ; jeton METRICS_TOKEN (Bearer) exigé, 404 sans jeton configuré."""
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(404, "Not Found")
+    if not compare_digest(authorization.encode(), f"Bearer {settings.METRICS_TOKEN}".encode()):
+        raise HTTPException(401, "Jeton de supervision invalide", headers={"WWW-Authenticate": "Bearer"})
+    return Response(render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,53 +1,165 @@
 # routers/upload.py
 
+import asyncio
+import hashlib
 import uuid
 import aiofiles
 from pathlib import Path
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import JSONResponse
 from PIL import Image
-import io
+from starlette.datastructures import UploadFile
+from starlette.types import Receive
 
 from core.config import settings
 from core.deps import CurrentUser
+from core.images import build_derivatives, check_pixels, describe_derivatives, run_in_pool
 
 router = APIRouter(prefix="/api/upload", tags=["Upload"])
 
 ALLOWED_TYPES = {"image/jpeg", "image/png", "image/webp", "image/gif"}
 MAX_BYTES = settings.MAX_FILE_SIZE_MB * 1024 * 1024
+# Corps multipart entier : le fichier plus l'enveloppe (délimiteurs, en-têtes de partie)
+MAX_BODY_BYTES = MAX_BYTES + 64 * 1024
+CHUNK_SIZE = 64 * 1024
 
+# Format Pillow détecté → extension enregistrée
+EXTENSIONS = {"JPEG": "jpg", "PNG": "png", "WEBP": "webp", "GIF": "gif"}
 
-@router.post("")
-async def upload_image(
-    _: CurrentUser,
-    file: UploadFile = File(...),
-):
-    # Vérifier le type MIME
-    if file.content_type not in ALLOWED_TYPES:
-        raise HTTPException(400, f"Type non supporté : {file.content_type}. Acceptés : JPEG, PNG, WEBP, GIF")
 
-    content = await file.read()
+def _sniff(header: bytes) -> str | None:
+    """Format d'après les octets magiques, avant tout décodage."""
+    if header.startswith(b"\xff\xd8\xff"):
+        return "JPEG"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "PNG"
+    if header[:6] in (b"GIF87a", b"GIF89a"):
+        return "GIF"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "WEBP"
+    return None
 
-    # Vérifier la taille
-    if len(content) > MAX_BYTES:
-        raise HTTPException(400, f"Fichier trop lourd (max {settings.MAX_FILE_SIZE_MB} Mo)")
 
-    # Vérifier que c'est une vraie image
-    try:
-        img = Image.open(io.BytesIO(content))
+def _inspect(path: Path) -> str:
+    """Vérifie l'image (bloquant — à lancer dans un thread) et renvoie son extension."""
+    with open(path, "rb") as f:
+        sniffed = _sniff(f.read(16))
+    if sniffed is None:
+        raise ValueError("signature inconnue")
+    # Image.open lit seulement l'en-tête : dimensions refusées avant tout décodage
+    with Image.open(path) as img:
+        if img.format != sniffed:
+            raise ValueError("format incohérent")
+        check_pixels(img)
         img.verify()
-    except Exception:
-        raise HTTPException(400, "Fichier image invalide ou corrompu")
+    return EXTENSIONS[sniffed]
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(413, f"Fichier trop lourd (max {settings.MAX_FILE_SIZE_MB} Mo)")
+
+
+def _limited(receive: Receive, limit: int) -> Receive:
+    """receive qui interrompt la lecture du corps dès limit octets dépassés (corps sans Content-Length)."""
+    received = 0
+
+    async def wrapped():
+        nonlocal received
+        message = await receive()
+        received += len(message.get("body", b""))
+        if received > limit:
+            raise _too_large()
+        return message
+
+    return wrapped
+
+
+# Corps lu par le handler (et non via File(...)) : FastAPI analyserait tout le
+# multipart, fichier recopié sur disque compris, avant toute vérification de taille
+UPLOAD_BODY = {
+    "required": True,
+    "content": {"multipart/form-data": {"schema": {
+        "type": "object", "required": ["file"],
+        "properties": {"file": {"type": "string", "format": "binary"}},
+    }}},
+}
+
+
+@router.post("", openapi_extra={"requestBody": UPLOAD_BODY})
+async def upload_image(request: Request, _: CurrentUser):
+    # Taille annoncée : refus avant d'avoir reçu le moindre octet du corps
+    try:
+        length = int(request.headers.get("content-length", 0))
+    except ValueError:
+        raise HTTPException(400, "Content-Length invalide")
+    if length > MAX_BODY_BYTES:
+        raise _too_large()
+
+    request = Request(request.scope, _limited(request.receive, MAX_BODY_BYTES))
+    async with request.form(max_files=1, max_fields=10) as form:
+        file = form.get("file")
+        if not isinstance(file, UploadFile):
+            raise HTTPException(400, "Champ « file » manquant")
+        return await _store(file)
+
+
+async def _store(file: UploadFile) -> JSONResponse:
+    # Vérifier le type MIME
+    if file.content_type not in ALLOWED_TYPES:
+        raise HTTPException(400, f"Type non supporté : {file.content_type}. Acceptés : JPEG, PNG, WEBP, GIF")
 
-    # Sauvegarder
     upload_path = Path(settings.UPLOAD_DIR)
-    upload_path.mkdir(parents=True, exist_ok=True)
+    tmp_dir = upload_path / ".tmp"
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    tmp = tmp_dir / f"{uuid.uuid4().hex}.part"
+
+    try:
+        # Copie par blocs vers un fichier temporaire : mémoire bornée, taille exacte du fichier.
+        # L'empreinte est calculée au passage : elle sert de nom de fichier.
+        size = 0
+        digest = hashlib.sha256()
+        async with aiofiles.open(tmp, "wb") as out:
+            while chunk := await file.read(CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_BYTES:
+                    raise _too_large()
+                digest.update(chunk)
+                await out.write(chunk)
 
-    ext = file.filename.rsplit(".", 1)[-1].lower() if "." in file.filename else "jpg"
-    filename = f"{uuid.uuid4().hex}.{ext}"
-    dest = upload_path / filename
+        # Vérifier que c'est une vraie image (décodage hors boucle asyncio)
+        try:
+            ext = await asyncio.to_thread(_inspect, tmp)
+        except Image.DecompressionBombError:
+            raise HTTPException(413, f"Image trop grande (max {Image.MAX_IMAGE_PIXELS} pixels)")
+        except Exception:
+            raise HTTPException(400, "Fichier image invalide ou corrompu")
 
-    async with aiofiles.open(dest, "wb") as f:
-        await f.write(content)
+        filename = f"{digest.hexdigest()}.{ext}"
+        dest = upload_path / filename
+        try:
+            if dest.is_file():
+                # Mêmes octets déjà reçus : on renvoie l'existant, rien n'est réécrit
+                derivatives = await asyncio.to_thread(describe_derivatives, str(dest), settings.image_widths_list)
+            else:
+                # Dérivés (largeurs WebP) puis original sans EXIF, publiés atomiquement
+                # par le pool de processus
+                derivatives = await run_in_pool(
+                    build_derivatives, str(tmp), str(dest),
+                    settings.image_widths_list, settings.IMAGE_WEBP_QUALITY, settings.IMAGE_JPEG_QUALITY,
+                )
+        except Exception:
+            raise HTTPException(400, "Image impossible à traiter")
+    finally:
+        tmp.unlink(missing_ok=True)
 
-    return JSONResponse({"url": f"/uploads/{filename}", "filename": filename})
\ No newline at end of file
+    variants = [
+        {"width": width, "url": f"/uploads/{name}"} for width, name in sorted(derivatives.variants.items())
+    ]
+    return JSONResponse({
+        "url": f"/uploads/{filename}",
+        "filename": filename,
+        "width": derivatives.width,
+        "height": derivatives.height,
+        "variants": variants,
+        "srcset": ", ".join(f"{v['url']} {v['width']}w" for v in variants),
+    })
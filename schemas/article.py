@@ -6,15 +6,19 @@ from schemas.category import CategoryOut
 from schemas.user import UserOut
 
 
-class ArticleBase(BaseModel):
+class ArticleFields(BaseModel):
+    """Champs saisis, communs à l'entrée et aux sorties — hors content (cf. ArticleSummaryOut)."""
     title: str
     excerpt: str | None = None
-    content: str = ""
     image_url: str | None = None
     category_id: int | None = None
     status: str = "draft"
 
 
+class ArticleBase(ArticleFields):
+    content: str = ""
+
+
 class ArticleCreate(ArticleBase):
     slug: str | None = None   # Auto-généré si absent
 
@@ -29,7 +33,12 @@ class ArticleUpdate(BaseModel):
     status: str | None = None
 
 
-class ArticleOut(ArticleBase):
+class ArticleUpdateItem(ArticleUpdate):
+    id: int                   # Modification groupée (PATCH /bulk)
+
+
+class ArticleSummaryOut(ArticleFields):
+    """Carte de liste : ArticleOut sans content."""
     id: int
     slug: str
     published_at: datetime | None
@@ -41,9 +50,19 @@ class ArticleOut(ArticleBase):
     model_config = {"from_attributes": True}
 
 
+class ArticleOut(ArticleSummaryOut, ArticleBase):
+    pass
+
+
 class ArticleListOut(BaseModel):
     items: list[ArticleOut]
-    total: int
-    total_pages: int
+    total: int | None          # None si include_total=false
+    total_pages: int | None
     page: int
-    per_page: int
\ No newline at end of file
+    per_page: int
+    has_more: bool = False
+    next_cursor: str | None = None
+
+
+class ArticleSummaryListOut(ArticleListOut):
+    items: list[ArticleSummaryOut]
\ No newline at end of file
@@ -7,10 +7,10 @@ from schemas.category import CategoryOut
 from schemas.user import UserOut
 
 
-class BoutiqueItemBase(BaseModel):
+class BoutiqueItemFields(BaseModel):
+    """Champs saisis, communs à l'entrée et aux sorties — hors content (cf. BoutiqueItemSummaryOut)."""
     name: str
     description: str | None = None
-    content: str | None = None
     image_url: str | None = None
     price: Decimal = Decimal("0")
     in_stock: bool = True
@@ -19,6 +19,10 @@ class BoutiqueItemBase(BaseModel):
     status: str = "draft"
 
 
+class BoutiqueItemBase(BoutiqueItemFields):
+    content: str | None = None
+
+
 class BoutiqueItemCreate(BoutiqueItemBase):
     slug: str | None = None
 
@@ -36,7 +40,12 @@ class BoutiqueItemUpdate(BaseModel):
     status: str | None = None
 
 
-class BoutiqueItemOut(BoutiqueItemBase):
+class BoutiqueItemUpdateItem(BoutiqueItemUpdate):
+    id: int                   # Modification groupée (PATCH /bulk)
+
+
+class BoutiqueItemSummaryOut(BoutiqueItemFields):
+    """Carte de liste : BoutiqueItemOut sans content."""
     id: int
     slug: str
     created_at: datetime
@@ -47,9 +56,19 @@ class BoutiqueItemOut(BoutiqueItemBase):
     model_config = {"from_attributes": True}
 
 
+class BoutiqueItemOut(BoutiqueItemSummaryOut, BoutiqueItemBase):
+    pass
+
+
 class BoutiqueListOut(BaseModel):
     items: list[BoutiqueItemOut]
-    total: int
-    total_pages: int
+    total: int | None          # None si include_total=false
+    total_pages: int | None
     page: int
-    per_page: int
\ No newline at end of file
+    per_page: int
+    has_more: bool = False
+    next_cursor: str | None = None
+
+
+class BoutiqueSummaryListOut(BoutiqueListOut):
+    items: list[BoutiqueItemSummaryOut]
\ No newline at end of file
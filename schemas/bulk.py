@@ -0,0 +1,37 @@
+# schemas/bulk.py
+
+from typing import Generic, Literal, TypeVar
+from pydantic import BaseModel, Field
+
+# Éléments max par lot : une transaction, des requêtes multi-lignes bornées
+BULK_MAX_ITEMS = 500
+
+T = TypeVar("T")
+
+BulkItemStatus = Literal["created", "updated", "deleted", "not_found", "invalid", "conflict"]
+
+
+class BulkItems(BaseModel, Generic[T]):
+    items: list[T] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class BulkIds(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class BulkStatusIn(BulkIds):
+    status: Literal["draft", "published"]
+
+
+class BulkItemResult(BaseModel):
+    index: int                     # position dans items / ids
+    status: BulkItemStatus
+    id: int | None = None
+    slug: str | None = None
+    detail: str | None = None      # motif d'un échec
+
+
+class BulkOut(BaseModel):
+    ok: int
+    failed: int
+    results: list[BulkItemResult]
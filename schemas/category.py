@@ -1,7 +1,7 @@
 # schemas/category.py
 
 from typing import Literal
-from pydantic import BaseModel
+from pydantic import BaseModel, RootModel
 
 ContentType = Literal["article", "publication", "boutique"]
 
@@ -24,4 +24,8 @@ class CategoryOut(CategoryBase):
     id: int
     slug: str
 
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    model_config = {"from_attributes": True}
+
+
+class CategoryListOut(RootModel[list[CategoryOut]]):
+    pass
@@ -6,15 +6,19 @@ from schemas.category import CategoryOut
 from schemas.user import UserOut
 
 
-class PublicationBase(BaseModel):
+class PublicationFields(BaseModel):
+    """Champs saisis, communs à l'entrée et aux sorties — hors content (cf. PublicationSummaryOut)."""
     title: str
     excerpt: str | None = None
-    content: str = ""
     image_url: str | None = None
     category_id: int | None = None
     status: str = "draft"
 
 
+class PublicationBase(PublicationFields):
+    content: str = ""
+
+
 class PublicationCreate(PublicationBase):
     slug: str | None = None
 
@@ -29,7 +33,12 @@ class PublicationUpdate(BaseModel):
     status: str | None = None
 
 
-class PublicationOut(PublicationBase):
+class PublicationUpdateItem(PublicationUpdate):
+    id: int                   # Modification groupée (PATCH /bulk)
+
+
+class PublicationSummaryOut(PublicationFields):
+    """Carte de liste : PublicationOut sans content."""
     id: int
     slug: str
     published_at: datetime | None
@@ -41,9 +50,19 @@ class PublicationOut(PublicationBase):
     model_config = {"from_attributes": True}
 
 
+class PublicationOut(PublicationSummaryOut, PublicationBase):
+    pass
+
+
 class PublicationListOut(BaseModel):
     items: list[PublicationOut]
-    total: int
-    total_pages: int
+    total: int | None          # None si include_total=false
+    total_pages: int | None
     page: int
-    per_page: int
\ No newline at end of file
+    per_page: int
+    has_more: bool = False
+    next_cursor: str | None = None
+
+
+class PublicationSummaryListOut(PublicationListOut):
+    items: list[PublicationSummaryOut]
\ No newline at end of file
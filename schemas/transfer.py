@@ -0,0 +1,9 @@
+# schemas/transfer.py
+
+from pydantic import BaseModel
+
+
+class ImportOut(BaseModel):
+    rows: int          # lignes lues dans le fichier
+    inserted: int
+    updated: int       # slug déjà présent : ligne remplacée
@@ -1,7 +1,7 @@
 # schemas/user.py
 
 from datetime import datetime
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
 
 class UserBase(BaseModel):
@@ -13,6 +13,11 @@ class UserCreate(UserBase):
     password: str
 
 
+class PasswordChange(BaseModel):
+    current_password: str
+    new_password: str = Field(min_length=8)
+
+
 class UserOut(UserBase):
     id: int
     is_active: bool
@@ -0,0 +1,17 @@
+# tests/conftest.py
+#
+# Tests sans base de données : réglages minimaux pour importer l'application
+# (le moteur est créé sans se connecter). pytest requis (outil de dev).
+# Les tests qui passent par les routers (test_routers.py) demandent une base
+# PostgreSQL DÉDIÉE, vidée et migrée par les tests ; ignorés sans TEST_DATABASE_URL.
+#
+#   python -m pytest
+#   TEST_DATABASE_URL=postgresql+asyncpg://postgres@localhost/mbj_test python -m pytest
+
+import os
+
+if os.environ.get("TEST_DATABASE_URL"):
+    os.environ["DATABASE_URL"] = os.environ["TEST_DATABASE_URL"]
+    os.environ["DATABASE_READ_URL"] = ""   # tout sur la base de test, même avec un .env
+os.environ.setdefault("DATABASE_URL", "postgresql+asyncpg://test@localhost/test")
+os.environ.setdefault("SECRET_KEY", "test")
@@ -0,0 +1,128 @@
+# tests/test_deps.py
+#
+# Authentification : claim « ver » comparé à users.token_version, et révocation
+# (revoke_tokens) qui retire du cache les principals du compte après le commit.
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+import models.category  # noqa — relations résolues par nom
+from core.deps import get_current_user, principal_cache, revoke_tokens
+from core.security import create_access_token
+from models.user import User
+
+
+class FakeResult:
+    def __init__(self, user):
+        self.user = user
+
+    def scalar_one_or_none(self):
+        return self.user
+
+
+class FakeSession:
+    """Session réduite à ce qu'utilisent get_current_user et revoke_tokens."""
+
+    def __init__(self, user):
+        self.user = user
+        self.info = {}
+        self.queries = 0
+
+    async def execute(self, *args, **kwargs):
+        self.queries += 1
+        return FakeResult(self.user)
+
+    def commit(self):
+        for callback in self.info.pop("after_commit", []):
+            callback()
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
+
+
+def make_user(token_version: int = 0, is_active: bool = True) -> User:
+    return User(
+        id=1, email="admin@example.org", username="admin", password="x", is_active=is_active,
+        is_admin=True, token_version=token_version, created_at=datetime.now(timezone.utc),
+    )
+
+
+def authenticate(token: str, db: FakeSession):
+    return asyncio.run(get_current_user(token, db))
+
+
+def test_matching_version_is_accepted_and_cached():
+    db = FakeSession(make_user(token_version=3))
+    token = create_access_token({"sub": "1", "ver": 3})
+    assert authenticate(token, db).token_version == 3
+    assert authenticate(token, db).id == 1
+    assert db.queries == 1
+
+
+def test_token_without_version_counts_as_zero():
+    token = create_access_token({"sub": "1"})
+    assert authenticate(token, FakeSession(make_user(token_version=0))).id == 1
+    principal_cache.clear()
+    with pytest.raises(HTTPException) as exc:
+        authenticate(token, FakeSession(make_user(token_version=1)))
+    assert exc.value.status_code == 401
+
+
+def test_version_mismatch_is_rejected():
+    token = create_access_token({"sub": "1", "ver": 0})
+    with pytest.raises(HTTPException) as exc:
+        authenticate(token, FakeSession(make_user(token_version=1)))
+    assert exc.value.status_code == 401
+
+
+def test_inactive_user_is_rejected():
+    token = create_access_token({"sub": "1", "ver": 0})
+    with pytest.raises(HTTPException):
+        authenticate(token, FakeSession(make_user(is_active=False)))
+
+
+def test_revoke_tokens_invalidates_cached_principal_after_commit():
+    user = make_user(token_version=0)
+    db = FakeSession(user)
+    token = create_access_token({"sub": "1", "ver": 0})
+    authenticate(token, db)
+
+    revoke_tokens(db, user)
+    assert user.token_version == 1
+    # Avant le commit, le principal en cache reste valable
+    assert authenticate(token, db).token_version == 0
+    db.commit()
+    with pytest.raises(HTTPException) as exc:
+        authenticate(token, db)
+    assert exc.value.status_code == 401
+
+
+def change_password(principal, user):
+    from routers.auth import change_password as endpoint
+    from schemas.user import PasswordChange
+
+    class Session(FakeSession):
+        async def get(self, model, ident):
+            return self.user
+
+    payload = PasswordChange(current_password="x", new_password="nouveau-mot-de-passe")
+    return asyncio.run(endpoint(payload, Session(user), principal))
+
+
+@pytest.mark.parametrize("user", [None, make_user(is_active=False), make_user(token_version=1)])
+def test_change_password_rejects_stale_principal(user):
+    token = create_access_token({"sub": "1", "ver": 0})
+    principal = authenticate(token, FakeSession(make_user()))
+    version = user.token_version if user is not None else None
+    with pytest.raises(HTTPException) as exc:
+        change_password(principal, user)
+    assert exc.value.status_code == 401
+    # Aucune révocation sur un compte qui n'est plus celui du jeton
+    assert (user.token_version if user is not None else None) == version
@@ -0,0 +1,122 @@
+# tests/test_routers.py
+#
+# SQL réellement émis par les routes de lecture des routers de contenu, sur une
+# base PostgreSQL dédiée (TEST_DATABASE_URL, vidée puis migrée ici) : une liste
+# exécute les mêmes requêtes pour 1 ligne que pour toute la page — aucun SELECT
+# par ligne (auteur, catégorie) — et aucune requête n'est répétée. Un router qui
+# oublierait load_fields déclencherait en plus un lazy load raise_on_sql (500).
+
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import text
+
+if not os.environ.get("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL non défini (base PostgreSQL dédiée)", allow_module_level=True)
+
+from alembic import command
+from alembic.config import Config
+from fastapi.testclient import TestClient
+
+from core.cache import caches
+from core.database import engine
+from core.metrics import query_hooks
+from main import app
+
+ROWS = 6
+# préfixe d'URL → (type de catégorie, table, corps de création sans titre/nom)
+CONTENT = {
+    "articles": ("article", "articles", {"content": "<p>x</p>"}),
+    "publications": ("publication", "publications", {"content": "<p>x</p>"}),
+    "boutique": ("boutique", "boutique_items", {"price": "12.50"}),
+}
+PUBLIC_LISTS = ("", "view=summary", "fields=id,slug,image_url", "category=cat-{kind}", "include_total=false")
+
+
+async def _execute(*sql: str) -> None:
+    async with engine.begin() as conn:
+        for statement in sql:
+            await conn.execute(text(statement))
+
+
+def _execute_sync(*sql: str) -> None:
+    async def run():
+        await _execute(*sql)
+        await engine.dispose()   # connexions liées à cette boucle, pas à celle du TestClient
+    asyncio.run(run())
+
+
+@pytest.fixture(scope="module")
+def client():
+    _execute_sync("DROP SCHEMA public CASCADE", "CREATE SCHEMA public")
+    command.upgrade(Config("alembic.ini"), "head")
+    with TestClient(app) as c:
+        c.post("/api/auth/init", json={"email": "admin@example.org", "username": "admin", "password": "motdepasse"})
+        token = c.post("/api/auth/login", data={"username": "admin@example.org", "password": "motdepasse"})
+        c.headers["Authorization"] = f"Bearer {token.json()['access_token']}"
+        # Second auteur : la moitié des lignes lui est attribuée (la carte d'identité
+        # de la session masquerait sinon un chargement d'auteur par ligne)
+        c.portal.call(_execute, "INSERT INTO users (email, username, password, is_active, is_admin, created_at) "
+                                "VALUES ('autre@example.org', 'autre', 'x', true, false, now())")
+        for prefix, (kind, table, body) in CONTENT.items():
+            name = "name" if prefix == "boutique" else "title"
+            category = c.post("/api/categories", json={"name": f"Cat {kind}", "content_type": kind}).json()
+            for i in range(ROWS):
+                created = c.post(f"/api/{prefix}", json=body | {
+                    name: f"{kind} {i}", "status": "published", "category_id": category["id"] if i % 2 else None,
+                })
+                assert created.status_code == 201, created.text
+            c.portal.call(_execute, f"UPDATE {table} SET author_id = (SELECT id FROM users WHERE username = 'autre') "
+                                    f"WHERE id % 2 = 0")
+        yield c
+
+
+def statements(client, url: str) -> list[str]:
+    """Requêtes SQL exécutées pendant un GET, caches de réponses et de totaux vidés."""
+    for cache in caches.values():
+        cache.clear()
+    seen = []
+    hook = lambda statement, *_: seen.append(statement)
+    query_hooks.append(hook)
+    try:
+        response = client.get(url)
+    finally:
+        query_hooks.remove(hook)
+    assert response.status_code == 200, response.text
+    return seen
+
+
+def assert_no_repeat(seen: list[str]) -> None:
+    assert len(seen) == len(set(seen)), "\n\n".join(seen)
+
+
+@pytest.mark.parametrize("prefix", CONTENT)
+@pytest.mark.parametrize("query", PUBLIC_LISTS)
+def test_public_list_statements_do_not_grow_with_rows(client, prefix, query):
+    query = query.format(kind=CONTENT[prefix][0])
+    url = f"/api/{prefix}?{query}&per_page="
+    one, page = statements(client, url + "1"), statements(client, url + str(ROWS))
+    assert one == page
+    assert_no_repeat(page)
+
+
+@pytest.mark.parametrize("prefix", CONTENT)
+def test_admin_list_statements_do_not_grow_with_rows(client, prefix):
+    url = f"/api/{prefix}/admin/all?per_page="
+    one, page = statements(client, url + "1"), statements(client, url + str(ROWS))
+    assert one == page
+    assert_no_repeat(page)
+
+
+@pytest.mark.parametrize("prefix", CONTENT)
+def test_detail_loads_row_and_author_in_one_statement(client, prefix):
+    items = client.get(f"/api/{prefix}?per_page={ROWS}").json()["items"]
+    table = CONTENT[prefix][1]
+    for item in items:
+        for url in (f"/api/{prefix}/{item['slug']}", f"/api/{prefix}/admin/{item['id']}"):
+            seen = statements(client, url)
+            assert_no_repeat(seen)
+            # Une seule requête lit la ligne (auteur joint) ; la catégorie vient du registre
+            assert [s for s in seen if f"FROM {table}" in s] == seen[-1:]
+            assert not any("FROM categories" in s for s in seen)
@@ -0,0 +1,105 @@
+# tests/test_statements.py
+#
+# SQL émis par les requêtes de core.statements pour chaque chemin des routers de
+# contenu : la ligne seule joint son auteur, jamais la catégorie (registre en
+# mémoire) ; totaux, existences, révalidations et pages ne joignent rien.
+
+import re
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from core.render import list_projection
+from core.statements import (
+    admin_filters, by_id, by_slug, list_page, list_stats, public_filters, slug_usage, slugs_usage, version_by_slug,
+)
+import models.category  # noqa — relations résolues par nom
+import models.user      # noqa
+from models.article import Article
+from models.boutique import BoutiqueItem
+from models.publication import Publication
+from schemas.article import ArticleListOut, ArticleSummaryListOut
+from schemas.boutique import BoutiqueListOut, BoutiqueSummaryListOut
+from schemas.publication import PublicationListOut, PublicationSummaryListOut
+
+# modèle → (colonne de recherche admin, date de tri publique, schémas de page)
+CONTENT = {
+    Article: ("title", "published_at", ArticleListOut, ArticleSummaryListOut),
+    Publication: ("title", "published_at", PublicationListOut, PublicationSummaryListOut),
+    BoutiqueItem: ("name", "created_at", BoutiqueListOut, BoutiqueSummaryListOut),
+}
+
+
+def sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def joined(statement) -> set[str]:
+    """Tables jointes (JOIN <table>) par la requête."""
+    return set(re.findall(r"JOIN (\w+)", sql(statement)))
+
+
+def public_filter_sets(model):
+    return [public_filters(model, category, search) for category in (False, True) for search in (False, True)]
+
+
+def admin_filter_sets(model):
+    search_col = CONTENT[model][0]
+    return [admin_filters(model, search_col, status, search) for status in (False, True) for search in (False, True)]
+
+
+@pytest.mark.parametrize("model", CONTENT)
+def test_single_row_joins_author_only(model):
+    for statement in (by_slug(model), by_id(model)):
+        assert joined(statement) == {"users"}
+        assert "categories" not in sql(statement)
+
+
+@pytest.mark.parametrize("model", CONTENT)
+def test_delete_lookup_joins_nothing(model):
+    assert joined(by_id(model, with_related=False)) == set()
+
+
+@pytest.mark.parametrize("model", CONTENT)
+def test_revalidation_joins_nothing(model):
+    statement = sql(version_by_slug(model))
+    assert joined(version_by_slug(model)) == set()
+    assert f"FROM {model.__tablename__} \nWHERE" in statement
+
+
+@pytest.mark.parametrize("model", CONTENT)
+def test_counts_join_nothing(model):
+    for filters in public_filter_sets(model) + admin_filter_sets(model):
+        statement = sql(list_stats(model, filters))
+        assert joined(list_stats(model, filters)) == set()
+        assert "users" not in statement and "categories" not in statement
+
+
+@pytest.mark.parametrize("model", CONTENT)
+def test_slug_existence_joins_no_relation(model):
+    assert joined(slug_usage(model)) == set()
+    # Créations groupées : jointure sur la table elle-même (bases demandées), rien d'autre
+    assert joined(slugs_usage(model)) == {model.__tablename__}
+
+
+@pytest.mark.parametrize("model", CONTENT)
+def test_public_pages_join_nothing(model):
+    _, date_col, list_out, summary_out = CONTENT[model]
+    views = [list_projection(list_out, summary_out, view, None)[1] for view in ("full", "summary")]
+    for filters in public_filter_sets(model):
+        for fields in views:
+            for by_rank in (False, True):
+                for cursor in (False, True):
+                    assert joined(list_page(model, date_col, filters, by_rank, cursor, fields)) == set()
+
+
+@pytest.mark.parametrize("model", CONTENT)
+def test_admin_pages_join_nothing(model):
+    for filters in admin_filter_sets(model):
+        for cursor in (False, True):
+            assert joined(list_page(model, "created_at", filters, cursor=cursor)) == set()
+
+
+def test_public_filters_use_published_literal():
+    # Littéral : l'index partiel « status = 'published' » reste utilisable
+    assert "articles.status = 'published'" in sql(list_stats(Article, public_filters(Article, False, False)))